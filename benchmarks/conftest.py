@@ -0,0 +1,113 @@
+import os
+import socket
+import sys
+import types
+
+import pytest
+
+BENCH_DIR = os.path.dirname(__file__)
+sys.path.insert(0, os.path.join(BENCH_DIR, "..", "src"))
+sys.path.insert(0, BENCH_DIR)
+
+# Must be set before the agents import transformers / load_dotenv.
+os.environ.setdefault("HF_HUB_OFFLINE", "1")
+os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
+os.environ.setdefault("NEWS_API_KEY", "offline-benchmark-key")
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+
+import tiny_models
+import synthetic
+from fake_services import FakeServices
+
+ARTICLE_SIZES = [1, 8, 32]
+HISTORY_SIZES = [10, 100, 1000]
+
+
+def record_throughput(benchmark, items, unit="items"):
+    """Adds items/second to the benchmark's `extra_info` so it lands in the JSON report."""
+    benchmark.extra_info[unit] = items
+    if benchmark.stats is not None and benchmark.stats.stats.mean > 0:
+        benchmark.extra_info[f"{unit}_per_sec"] = round(items / benchmark.stats.stats.mean, 2)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def no_network():
+    """Fails any connection that does not go to the loopback interface."""
+    real_connect = socket.socket.connect
+
+    def guarded_connect(self, address):
+        host = address[0] if isinstance(address, tuple) else address
+        if self.family in (socket.AF_INET, socket.AF_INET6) and host not in ("127.0.0.1", "::1", "localhost"):
+            raise ConnectionRefusedError(f"benchmarks run offline, refused connection to {host}")
+        return real_connect(self, address)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(socket.socket, "connect", guarded_connect)
+        yield
+
+
+@pytest.fixture(scope="session")
+def fake_services():
+    services = FakeServices().start()
+    yield services
+    services.stop()
+
+
+@pytest.fixture
+def offline(fake_services, monkeypatch):
+    """Points ticker_finder, NewsAPI and yfinance at the local fake services."""
+    from utils import ticker_finder
+    from agents import news_retrieval_agent
+
+    monkeypatch.setattr(ticker_finder, "YAHOO_SEARCH_URL", fake_services.yahoo_search_url)
+    monkeypatch.setattr(news_retrieval_agent, "yf", types.SimpleNamespace(Ticker=fake_services.ticker_class()))
+    # Re-set to itself so tests may change the news count and have it restored afterwards.
+    monkeypatch.setattr(fake_services, "yahoo_news_count", fake_services.yahoo_news_count)
+    return fake_services
+
+
+@pytest.fixture(scope="session")
+def model_paths(tmp_path_factory):
+    return tiny_models.build_all(str(tmp_path_factory.mktemp("tiny_models")), synthetic.corpus())
+
+
+@pytest.fixture(scope="session")
+def sentiment_agent(model_paths):
+    from agents.sentiment_analysis_agent import SentimentAnalysisAgent
+    return SentimentAnalysisAgent(model_preference="transformers", model_name=model_paths["finbert"])
+
+
+@pytest.fixture(scope="session")
+def evaluator(model_paths):
+    from agents.evaluator_optimizer_agent import EvaluatorOptimizer
+    return EvaluatorOptimizer(model_name=model_paths["minilm"])
+
+
+@pytest.fixture(scope="session")
+def specialists(model_paths):
+    from agents.specialist_agent import Specialist
+    return {topic: Specialist(topic, base_dir=model_paths["specialists"]) for topic in tiny_models.TOPICS}
+
+
+@pytest.fixture
+def news_agent_factory(offline):
+    from agents.news_retrieval_agent import NewsRetrievalAgent
+    from utils.http_transport import HTTPTransport
+
+    def make(mode="live", cassette_path=None):
+        agent = NewsRetrievalAgent(transport=HTTPTransport(mode, cassette_path))
+        agent.news_api_base_url = offline.news_api_url
+        return agent
+    return make
+
+
+@pytest.fixture
+def news_agent(news_agent_factory):
+    return news_agent_factory()
+
+
+@pytest.fixture
+def history_factory(tmp_path):
+    def make(entries_per_ticker):
+        return synthetic.make_history(str(tmp_path / f"history_{entries_per_ticker}.json"), entries_per_ticker)
+    return make
@@ -0,0 +1,156 @@
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import requests
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def _load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), "r") as f:
+        return json.load(f)
+
+
+def _fill(value, ticker, company):
+    if isinstance(value, str):
+        return (value.replace("{ticker_lower}", ticker.lower())
+                     .replace("{ticker}", ticker)
+                     .replace("{company}", company))
+    if isinstance(value, dict):
+        return {k: _fill(v, ticker, company) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_fill(v, ticker, company) for v in value]
+    return value
+
+
+def _expand(templates, count, ticker, company, url_key):
+    """
+    Cycles the recorded templates up to `count` items, keeping titles and links unique.
+    `url_key` names the link field of flat NewsAPI articles, None means Yahoo's nested `content`.
+    """
+    items = []
+    for i in range(count):
+        item = _fill(templates[i % len(templates)], ticker, company)
+        if i >= len(templates):
+            cycle = i // len(templates)
+            if url_key is None:
+                item["content"]["title"] += f" ({cycle})"
+                item["content"]["canonicalUrl"]["url"] += f"?v={cycle}"
+            else:
+                item["title"] += f" ({cycle})"
+                item[url_key] += f"?v={cycle}"
+        items.append(item)
+    return items
+
+
+class FakeServices:
+    """
+    Local stand-in for the Yahoo Finance search, quote and news endpoints and for the
+    NewsAPI `/v2/everything` endpoint, serving the recorded payloads in `fixtures/`.
+
+    `yahoo_news_count` controls how many Yahoo news items are returned per ticker,
+    NewsAPI honours the `pageSize` query parameter like the real service.
+    """
+
+    def __init__(self, yahoo_news_count=10):
+        self.yahoo_news_count = yahoo_news_count
+        self.search = _load_fixture("yahoo_search.json")
+        self.quotes = _load_fixture("yahoo_quote.json")
+        self.yahoo_news = _load_fixture("yahoo_news.json")
+        self.newsapi = _load_fixture("newsapi_everything.json")
+        self.request_count = 0
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def yahoo_search_url(self):
+        return f"{self.base_url}/v1/finance/search"
+
+    @property
+    def news_api_url(self):
+        return f"{self.base_url}/v2/everything"
+
+    def start(self):
+        services = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                services.request_count += 1
+                parsed = urlparse(self.path)
+                params = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+                status, payload = services.route(parsed.path, params)
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def company_for(self, ticker):
+        quote = self.quotes.get(ticker, {})
+        return quote.get("longName", ticker)
+
+    def route(self, path, params):
+        if path == "/v1/finance/search":
+            payload = self.search.get(params.get("q", "").lower().strip())
+            return 200, payload or {"quotes": [], "news": [], "count": 0}
+
+        if path.startswith("/yahoo/quote/"):
+            ticker = path.rsplit("/", 1)[-1]
+            return 200, self.quotes.get(ticker, {})
+
+        if path.startswith("/yahoo/news/"):
+            ticker = path.rsplit("/", 1)[-1]
+            if ticker not in self.quotes:
+                return 200, []
+            return 200, _expand(self.yahoo_news, self.yahoo_news_count, ticker, self.company_for(ticker), None)
+
+        if path == "/v2/everything":
+            ticker = params.get("q", "").split(" OR ")[0]
+            if ticker not in self.quotes:
+                return 200, {"status": "ok", "totalResults": 0, "articles": []}
+            page_size = int(params.get("pageSize", 100))
+            articles = _expand(self.newsapi["articles"], page_size, ticker, self.company_for(ticker), "url")
+            return 200, {"status": "ok", "totalResults": len(articles), "articles": articles}
+
+        return 404, {"error": "not found"}
+
+    def ticker_class(self):
+        """Returns a `yfinance.Ticker` replacement that reads news and info from this server."""
+        base_url = self.base_url
+
+        class FakeTicker:
+            def __init__(self, ticker):
+                self.ticker = ticker
+
+            @property
+            def info(self):
+                return requests.get(f"{base_url}/yahoo/quote/{self.ticker}", timeout=10).json()
+
+            @property
+            def news(self):
+                return requests.get(f"{base_url}/yahoo/news/{self.ticker}", timeout=10).json()
+
+        return FakeTicker
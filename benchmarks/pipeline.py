@@ -0,0 +1,96 @@
+import time
+from contextlib import contextmanager
+
+from utils.ticker_finder import get_ticker_from_company_name
+from memory.memory_agent import MemoryAgent
+from memory.sentiment_index import SentimentIndex
+from agents.topic_classifier_agent import TopicClassifier
+
+COMPANIES = ["apple", "microsoft", "google", "tesla", "nvidia", "intel"]
+
+
+class StageTimer:
+
+    def __init__(self):
+        self.timings = {}
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+
+
+def run_pipeline(query, agents, history_path, limit=3, days_back=7, max_iterations=3, target_score=90, timer=None):
+    """
+    Runs the flow of `src/main/pipeline.ipynb` end to end with already constructed agents.
+
+    `agents` holds `news`, `sentiment`, `evaluator` and a `specialists` dict keyed by topic,
+    so model loading stays out of the measured path, plus an optional `sentiment_index`
+    (a fresh in-memory one otherwise). Returns the final answer and score.
+    """
+    timer = timer or StageTimer()
+
+    with timer.stage("ticker"):
+        company_name = next(c for c in COMPANIES if c in query.lower())
+        ticker = get_ticker_from_company_name(company_name)
+
+    with timer.stage("memory_load"):
+        memory_agent = MemoryAgent(history_path)
+        stored_queries = memory_agent.load_entries(ticker)
+
+    with timer.stage("retrieval"):
+        json_data = agents["news"].get_news_json(company_names=COMPANIES, limit_per_source=limit, days_back=days_back)
+        articles = json_data["data"].get(ticker, {}).get("articles", [])
+        news = [article["summary"] for article in articles]
+
+    with timer.stage("sentiment"):
+        sentiment_index = agents.get("sentiment_index") or SentimentIndex()
+        new_articles = [article for article in articles if not sentiment_index.seen(ticker, article)]
+        sentiments = agents["sentiment"].predict_batch([article["summary"] for article in new_articles])
+        sentiment_index.update_articles(ticker, new_articles, sentiments)
+        ticker_sentiment = sentiment_index.current(ticker)
+        overall_sentiment = ticker_sentiment.label if ticker_sentiment else "neutral"
+
+    with timer.stage("topic"):
+        topic = TopicClassifier().classify(query)
+
+    specialist = agents["specialists"][topic]
+    best_answer, best_score, feedback = None, 0, ""
+    for _ in range(max_iterations):
+        with timer.stage("specialist"):
+            answer, _ = specialist.respond(
+                query=query,
+                news_summaries=news,
+                past_queries=stored_queries,
+                SA_label=overall_sentiment,
+                feedback=feedback,
+            )
+        with timer.stage("evaluator"):
+            evaluation = agents["evaluator"].evaluate_response(
+                original_query=query,
+                news_summaries=news,
+                past_queries=stored_queries,
+                specialist_response=answer,
+            )
+        current_score = evaluation["overall_score"]
+        if current_score > best_score:
+            best_score, best_answer = current_score, answer
+        if current_score >= target_score:
+            break
+        feedback = evaluation["actionable_feedback"]
+        if evaluation["critical_issues"]:
+            feedback += f" Focus on: {'. '.join(evaluation['critical_issues'])}"
+
+    with timer.stage("memory_save"):
+        memory_agent.save_entry({
+            "question": query,
+            "articles": news,
+            "SA": overall_sentiment,
+            "feedback": feedback,
+            "answer": answer,
+        }, ticker)
+
+    return (best_answer or answer), (best_score if best_answer else current_score)
@@ -0,0 +1,70 @@
+import json
+import random
+
+TICKERS = ["AAPL", "MSFT", "GOOGL", "TSLA", "NVDA", "INTC"]
+
+_SUBJECTS = ["shares", "revenue", "earnings", "the stock", "margins", "guidance", "demand", "sales"]
+_MOVES = ["rose", "fell", "climbed", "dropped", "held steady", "beat estimates", "missed estimates", "surged"]
+_REASONS = [
+    "after analysts raised their price target",
+    "amid supply chain concerns",
+    "as the broader market slid",
+    "following a new partnership announcement",
+    "on strong services growth",
+    "after regulators opened a probe",
+]
+_QUESTIONS = [
+    "How are {t}'s stocks doing?",
+    "What is the current value of {t}?",
+    "What did {t} announce this week?",
+    "Is {t} a good buy right now?",
+    "What is {t}'s pricing strategy?",
+]
+
+
+def sentence(rng, ticker):
+    return f"{ticker} {rng.choice(_SUBJECTS)} {rng.choice(_MOVES)} {rng.choice(_REASONS)}."
+
+
+def article(rng, ticker, sentences=3):
+    return " ".join(sentence(rng, ticker) for _ in range(sentences))
+
+
+def history_entry(rng, ticker, articles_per_entry=3):
+    return {
+        "question": rng.choice(_QUESTIONS).format(t=ticker),
+        "articles": [article(rng, ticker) for _ in range(articles_per_entry)],
+        "SA": rng.choice(["positive", "negative", "neutral"]),
+        "feedback": "",
+        "answer": sentence(rng, ticker),
+    }
+
+
+def make_history(path, entries_per_ticker, tickers=TICKERS, seed=0):
+    """Writes a `history.json` in the MemoryAgent layout with `entries_per_ticker` entries per ticker."""
+    rng = random.Random(seed)
+    data = {t: [history_entry(rng, t) for _ in range(entries_per_ticker)] for t in tickers}
+    with open(path, "w") as f:
+        json.dump(data, f, indent=4)
+    return path
+
+
+def make_articles(count, ticker="AAPL", seed=0):
+    rng = random.Random(seed)
+    return [article(rng, ticker) for _ in range(count)]
+
+
+def corpus(seed=0):
+    """Text used to build the tiny tokenizer vocabularies, so benchmarks tokenise mostly whole words."""
+    from fake_services import FakeServices
+
+    services = FakeServices()
+    rng = random.Random(seed)
+    texts = [article(rng, t) for t in TICKERS for _ in range(5)]
+    texts += [q.format(t=t) for q in _QUESTIONS for t in TICKERS]
+    for ticker in services.quotes:
+        _, payload = services.route("/v2/everything", {"q": ticker, "pageSize": 5})
+        texts += [a["title"] + " " + a["description"] for a in payload["articles"]]
+        _, news = services.route(f"/yahoo/news/{ticker}", {})
+        texts += [n["content"]["title"] + " " + n["content"]["summary"] for n in news]
+    return texts
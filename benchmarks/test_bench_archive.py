@@ -0,0 +1,174 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import synthetic
+from conftest import record_throughput
+
+APPEND_SIZES = [100, 1000, 10000]
+ARCHIVE_DAYS = 90
+ARCHIVE_ARTICLES = 20000
+END = datetime(2025, 10, 20, tzinfo=timezone.utc)
+
+
+def _archived_articles(count, days=ARCHIVE_DAYS, seed=0):
+    """Retrieval dicts spread over `days` days and every ticker, shaped like NewsRetrievalAgent.get_news output."""
+    rng = random.Random(seed)
+    articles = []
+    for i in range(count):
+        ticker = rng.choice(synthetic.TICKERS)
+        published = END - timedelta(seconds=rng.random() * days * 86400)
+        text = synthetic.article(rng, ticker)
+        articles.append({
+            'title': text.split(" ", 8)[-1][:60],
+            'publisher': rng.choice(["Reuters", "Bloomberg", "CNBC"]),
+            'link': f"https://news.example.com/{ticker.lower()}/{i}",
+            'published_date': published.isoformat(),
+            'summary': text,
+            'content': text * 4,
+            'ticker': ticker,
+            'company_name': ticker,
+            'source': rng.choice(["yahoo_finance", "news_api"]),
+        })
+    return articles
+
+
+@pytest.fixture(scope="module")
+def filled_archive(tmp_path_factory):
+    from memory.news_archive import NewsArchive
+
+    archive = NewsArchive(str(tmp_path_factory.mktemp("archive")))
+    articles = _archived_articles(ARCHIVE_ARTICLES)
+    # Daily retrieval batches, as an agent appending after every run would produce.
+    for day in range(0, len(articles), 1000):
+        archive.append(articles[day:day + 1000])
+    archive.compact()
+    return archive
+
+
+@pytest.mark.parametrize("count", APPEND_SIZES)
+def test_archive_append(benchmark, tmp_path, count):
+    from memory.news_archive import NewsArchive
+
+    articles = _archived_articles(count)
+    roots = iter(range(10))
+
+    def append():
+        return NewsArchive(str(tmp_path / f"run{next(roots)}")).append(articles)
+
+    added = benchmark.pedantic(append, rounds=3, iterations=1)
+
+    assert added == count
+    record_throughput(benchmark, count, "articles")
+
+
+def test_archive_read_full(benchmark, filled_archive):
+    # Baseline: everything into pandas, then filtered there.
+    def read():
+        df = filled_archive.to_pandas()
+        return df[(df["ticker"] == "AAPL") & (df["published_at"] >= END - timedelta(days=7))][["title", "published_at"]]
+
+    df = benchmark(read)
+
+    assert 0 < len(df) < ARCHIVE_ARTICLES
+    record_throughput(benchmark, len(df), "articles")
+
+
+def test_archive_read_pushdown(benchmark, filled_archive):
+    table = benchmark(filled_archive.read, tickers="AAPL", start=END - timedelta(days=7), columns=["title", "published_at"])
+
+    assert table.column_names == ["title", "published_at"]
+    assert 0 < table.num_rows < ARCHIVE_ARTICLES
+    record_throughput(benchmark, table.num_rows, "articles")
+
+
+def test_archive_scan_batches(benchmark, filled_archive):
+    # Streaming aggregate over the whole period without materialising a table.
+    def count_by_source():
+        counts = {}
+        for batch in filled_archive.scanner(columns=["source"], batch_size=4096).to_batches():
+            for source in batch.column("source").to_pylist():
+                counts[source] = counts.get(source, 0) + 1
+        return counts
+
+    counts = benchmark(count_by_source)
+
+    assert sum(counts.values()) == ARCHIVE_ARTICLES
+    record_throughput(benchmark, ARCHIVE_ARTICLES, "articles")
+
+
+def test_archive_dedup_and_compact(tmp_path):
+    from memory.news_archive import NewsArchive
+
+    articles = _archived_articles(200, days=5)
+    archive = NewsArchive(str(tmp_path))
+
+    assert archive.append(articles[:150]) == 150
+    assert archive.append(articles) == 50
+    # A new instance rebuilds the dedup state from the files on disk.
+    assert NewsArchive(str(tmp_path)).append(articles) == 0
+
+    archive.compact()
+    assert archive.read().num_rows == 200
+    assert archive.tickers() == sorted({a["ticker"] for a in articles})
+    news_api = archive.read(source="news_api", columns=["source"]).column("source").to_pylist()
+    assert news_api == ["news_api"] * sum(a["source"] == "news_api" for a in articles)
+
+
+def test_get_news_dataframe_from_archive(news_agent, offline, tmp_path):
+    from memory.news_archive import NewsArchive
+
+    news_agent.archive = NewsArchive(str(tmp_path))
+    live = news_agent.get_news_dataframe("apple", None, limit_per_source=5, days_back=7)
+    requests_before = offline.request_count
+
+    archived = news_agent.get_news_dataframe("AAPL", None, days_back=None, from_archive=True, columns=["title", "link", "source"])
+
+    assert offline.request_count == requests_before
+    assert list(archived.columns) == ["title", "link", "source"]
+    assert sorted(archived["link"]) == sorted(live["link"])
+
+
+def test_archive_dedup_across_dates(tmp_path):
+    from memory.news_archive import NewsArchive
+
+    archive = NewsArchive(str(tmp_path))
+    undated = {'title': 'T1', 'link': '', 'published_date': '', 'ticker': 'AAPL', 'source': 'yahoo_finance'}
+    yahoo = {'title': 'T2', 'link': 'https://x/2', 'published_date': '2025-10-19T23:58:00Z', 'ticker': 'AAPL', 'source': 'yahoo_finance'}
+    newsapi = dict(yahoo, published_date='2025-10-20T00:03:00Z', source='news_api')
+
+    assert archive.append([undated, yahoo], retrieved_at=END) == 2
+    # Next day: the undated article lands in another date partition, the link in another day.
+    assert archive.append([undated, newsapi], retrieved_at=END + timedelta(days=1)) == 0
+    assert NewsArchive(str(tmp_path)).append([undated, newsapi]) == 0
+
+    rows = archive.read(columns=["title", "link"]).to_pylist()
+    assert sorted(rows, key=lambda r: r["title"]) == [{'title': 'T1', 'link': ''}, {'title': 'T2', 'link': 'https://x/2'}]
+
+
+def test_get_news_survives_archive_errors(news_agent, offline):
+    class BrokenArchive:
+        def append(self, articles):
+            raise OSError("disk full")
+
+    news_agent.archive = BrokenArchive()
+
+    assert len(news_agent.get_news("apple", "news_api", limit_per_source=3)) == 3
+
+
+def test_archive_special_character_tickers(tmp_path):
+    from memory.news_archive import NewsArchive
+
+    article = {'title': 'S&P 500 closes higher', 'link': 'https://x/spx', 'published_date': '2025-10-20T21:00:00Z', 'ticker': '^GSPC'}
+
+    assert NewsArchive(str(tmp_path)).append([article]) == 1
+    # pyarrow stores this partition as ticker=%5EGSPC; a fresh instance must still see the link.
+    archive = NewsArchive(str(tmp_path))
+    assert archive.append([article]) == 0
+    assert archive.read(tickers="^GSPC").num_rows == 1
+    assert archive.tickers() == ["^GSPC"]
+
+    archive.append([dict(article, link='https://x/spx2')])
+    archive.compact("^GSPC")
+    assert archive.read(tickers="^GSPC").num_rows == 2
@@ -0,0 +1,39 @@
+import random
+
+import pytest
+
+import synthetic
+from conftest import HISTORY_SIZES, record_throughput
+
+
+@pytest.mark.parametrize("entries", HISTORY_SIZES)
+def test_memory_load_entries(benchmark, history_factory, entries):
+    from memory.memory_agent import MemoryAgent
+
+    agent = MemoryAgent(history_factory(entries))
+
+    stored = benchmark(agent.load_entries, "AAPL")
+
+    assert len(stored) == entries
+    record_throughput(benchmark, 1, "loads")
+
+
+@pytest.mark.parametrize("entries", HISTORY_SIZES)
+def test_memory_save_entry(benchmark, history_factory, entries):
+    from memory.memory_agent import MemoryAgent
+
+    path = history_factory(entries)
+    agent = MemoryAgent(path)
+    rng = random.Random(0)
+    saves = []
+
+    def setup():
+        saves.append(1)
+        return (synthetic.history_entry(rng, "AAPL"), "AAPL"), {}
+
+    # Each round appends, so the file grows slightly; rounds are capped to keep sizes comparable.
+    # With --benchmark-disable pedantic runs once, so count the calls instead of assuming 10.
+    benchmark.pedantic(agent.save_entry, setup=setup, rounds=10)
+
+    assert len(agent.load_entries("AAPL")) == entries + len(saves)
+    record_throughput(benchmark, 1, "saves")
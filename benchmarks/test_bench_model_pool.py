@@ -0,0 +1,154 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+import synthetic
+from conftest import record_throughput
+
+CONCURRENCY = [1, 4, 16]
+REQUESTS_PER_RUN = 32
+
+
+@pytest.fixture(scope="module")
+def pool(model_paths):
+    from utils.model_pool import ModelPool
+
+    with ModelPool(
+        sentiment_model=model_paths["finbert"],
+        encoder_model=model_paths["minilm"],
+        specialists_dir=model_paths["specialists"],
+        topics=["markets_trading"],
+        max_wait_ms=5,
+    ) as pool:
+        yield pool
+
+
+@pytest.fixture
+def pooled_sentiment(pool):
+    from agents.sentiment_analysis_agent import SentimentAnalysisAgent
+    return SentimentAnalysisAgent(backend=pool.sentiment_backend())
+
+
+def _run_concurrently(fn, items, concurrency):
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(fn, items))
+
+
+def test_pooled_agents_match_in_process(pool, pooled_sentiment, sentiment_agent, evaluator, specialists):
+    from agents.evaluator_optimizer_agent import EvaluatorOptimizer
+    from agents.specialist_agent import Specialist
+
+    articles = synthetic.make_articles(8)
+    assert [r.label for r in pooled_sentiment.predict_batch(articles)] == [r.label for r in sentiment_agent.predict_batch(articles)]
+
+    pooled_embeddings = EvaluatorOptimizer(model=pool.encoder()).model.encode(articles)
+    assert np.allclose(pooled_embeddings, evaluator.model.encode(articles), atol=1e-4)
+
+    pooled_specialist = Specialist("markets_trading", generator=pool.generator("markets_trading"))
+    query = dict(query="How are AAPL shares doing?", news_summaries=articles[:2], past_queries=[])
+    assert pooled_specialist.respond(**query) == specialists["markets_trading"].respond(**query)
+
+
+@pytest.mark.parametrize("concurrency", CONCURRENCY)
+def test_sentiment_concurrent_in_process(benchmark, sentiment_agent, concurrency):
+    # Baseline: one shared in-process model, which must be serialised across threads.
+    lock = threading.Lock()
+    articles = synthetic.make_articles(REQUESTS_PER_RUN)
+
+    def predict(text):
+        with lock:
+            return sentiment_agent.predict_one(text)
+
+    results = benchmark.pedantic(_run_concurrently, args=(predict, articles, concurrency), rounds=3, iterations=1)
+
+    assert len(results) == REQUESTS_PER_RUN
+    record_throughput(benchmark, REQUESTS_PER_RUN, "requests")
+
+
+@pytest.mark.parametrize("concurrency", CONCURRENCY)
+def test_sentiment_concurrent_pooled(benchmark, pool, pooled_sentiment, concurrency):
+    articles = synthetic.make_articles(REQUESTS_PER_RUN)
+    batches_before = len(pool.batchers["sentiment"].batch_sizes)
+
+    results = benchmark.pedantic(_run_concurrently, args=(pooled_sentiment.predict_one, articles, concurrency), rounds=3, iterations=1)
+
+    assert len(results) == REQUESTS_PER_RUN
+    batch_sizes = pool.batchers["sentiment"].batch_sizes[batches_before:]
+    benchmark.extra_info["mean_batch_size"] = round(sum(batch_sizes) / len(batch_sizes), 2)
+    record_throughput(benchmark, REQUESTS_PER_RUN, "requests")
+
+
+@pytest.mark.parametrize("concurrency", CONCURRENCY)
+def test_encoder_concurrent_pooled(benchmark, pool, concurrency):
+    encoder = pool.encoder()
+    articles = synthetic.make_articles(REQUESTS_PER_RUN)
+
+    results = benchmark.pedantic(_run_concurrently, args=(encoder.encode, articles, concurrency), rounds=3, iterations=1)
+
+    assert len(results) == REQUESTS_PER_RUN
+    record_throughput(benchmark, REQUESTS_PER_RUN, "requests")
+
+
+def test_generator_concurrent_pooled(benchmark, pool):
+    generator = pool.generator("markets_trading")
+    prompts = [f"Answer the query: {a}" for a in synthetic.make_articles(4)]
+
+    results = benchmark.pedantic(_run_concurrently, args=(generator.generate, prompts, len(prompts)), rounds=2, iterations=1)
+
+    assert len(results) == len(prompts)
+    benchmark.extra_info["max_batch_size"] = max(pool.batchers["generator"].batch_sizes)
+    record_throughput(benchmark, len(prompts), "requests")
+
+
+def test_micro_batcher_groups_by_key():
+    from utils.model_pool import MicroBatcher
+
+    seen = []
+
+    def process(key, items):
+        seen.append((key, list(items)))
+        return [f"{key}:{item}" for item in items]
+
+    batcher = MicroBatcher(process, max_batch_size=4, max_wait_ms=50)
+    futures = [batcher.submit("a" if i % 2 else "b", i) for i in range(6)]
+    results = [f.result(timeout=5) for f in futures]
+    batcher.close()
+
+    assert results == [f"{'a' if i % 2 else 'b'}:{i}" for i in range(6)]
+    assert all(len(items) <= 4 and all((i % 2 == 1) == (key == "a") for i in items) for key, items in seen)
+
+
+def test_micro_batcher_isolates_failing_items():
+    from utils.model_pool import MicroBatcher
+
+    def process(key, items):
+        if "bad" in items:
+            raise ValueError("bad input")
+        return [item.upper() for item in items]
+
+    batcher = MicroBatcher(process, max_batch_size=4, max_wait_ms=50)
+    futures = [batcher.submit("k", item) for item in ["a", "bad", "c"]]
+    batcher.close()
+
+    assert futures[0].result(timeout=5) == "A"
+    assert futures[2].result(timeout=5) == "C"
+    with pytest.raises(ValueError):
+        futures[1].result(timeout=5)
+
+
+def test_sentiment_worker_falls_back_to_vader(tmp_path, monkeypatch):
+    import agents.sentiment_analysis_agent as sentiment_module
+    from utils.model_pool import _load_family
+
+    class FakeVADER:
+        def predict(self, texts):
+            return [("neutral", 1.0, "vader") for _ in texts]
+
+    # The VADER lexicon is not downloaded in the offline suite; only the fallback path matters here.
+    monkeypatch.setattr(sentiment_module, "_VADERBackend", FakeVADER)
+    monkeypatch.delenv("SENTIMENT_BACKEND", raising=False)
+    handler = _load_family("sentiment", {"sentiment_model": str(tmp_path / "missing-model")})
+
+    assert handler(None, ["Shares surged.", "The company faces a lawsuit."]) == [("neutral", 1.0, "vader")] * 2
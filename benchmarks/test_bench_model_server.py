@@ -0,0 +1,91 @@
+import pytest
+
+import synthetic
+from conftest import ARTICLE_SIZES, record_throughput
+
+
+@pytest.fixture(scope="module")
+def model_server(model_paths):
+    from utils.model_server import ModelServer
+
+    server = ModelServer(
+        port=0,
+        sentiment_model=model_paths["finbert"],
+        evaluator_model=model_paths["minilm"],
+        specialists_dir=model_paths["specialists"],
+    ).start()
+    server.preload()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def client(model_server):
+    from utils.model_server import ModelServerClient
+    return ModelServerClient(model_server.url)
+
+
+def test_health_round_trip(benchmark, client):
+    status = benchmark(client.health)
+
+    assert "sentiment" in status["loaded"]
+    record_throughput(benchmark, 1, "requests")
+
+
+@pytest.mark.parametrize("count", ARTICLE_SIZES)
+def test_remote_sentiment_predict_batch(benchmark, client, sentiment_agent, count):
+    from utils.model_server import RemoteSentimentAnalysisAgent
+
+    articles = synthetic.make_articles(count)
+    remote = RemoteSentimentAnalysisAgent(client)
+
+    results = benchmark(remote.predict_batch, articles)
+
+    assert [r.label for r in results] == [r.label for r in sentiment_agent.predict_batch(articles)]
+    record_throughput(benchmark, count, "articles")
+
+
+def test_remote_evaluator(benchmark, client):
+    from utils.model_server import RemoteEvaluatorOptimizer
+
+    remote = RemoteEvaluatorOptimizer(client)
+    news = synthetic.make_articles(8)
+
+    result = benchmark(remote.evaluate_response, "How are AAPL shares doing?", news, [], "AAPL shares rose. Revenue beat estimates.")
+
+    assert 0 <= result["overall_score"] <= 100
+    record_throughput(benchmark, 1, "evaluations")
+
+
+def test_remote_specialist(benchmark, client):
+    from utils.model_server import RemoteSpecialist
+
+    remote = RemoteSpecialist("markets_trading", client)
+
+    answer, prompt = benchmark.pedantic(
+        remote.respond,
+        kwargs=dict(query="How are AAPL shares doing?", news_summaries=synthetic.make_articles(3), past_queries=[]),
+        rounds=3,
+        iterations=1,
+    )
+
+    assert "markets_trading" in prompt
+    record_throughput(benchmark, 1, "responses")
+
+
+def test_unknown_topic_is_rejected(client):
+    from utils.model_server import ModelServerError, RemoteSpecialist
+
+    with pytest.raises(ModelServerError):
+        RemoteSpecialist("weather", client).respond("q", [], [])
+
+
+def test_field_errors_and_model_errors(model_server, monkeypatch):
+    status, body = model_server.handle("/evaluator/evaluate_response", {"original_query": "q"})
+    assert status == 400 and "news_summaries" in body["error"]
+
+    # A KeyError raised inside model code is a server error, not a bad request.
+    agent, _ = model_server.agent("sentiment")
+    monkeypatch.setattr(agent, "predict_one", lambda text, id=None: {}["label"])
+    status, body = model_server.handle("/sentiment/predict_one", {"text": "shares rose"})
+    assert status == 500 and body["error"].startswith("KeyError")
@@ -0,0 +1,62 @@
+import pytest
+
+import synthetic
+from conftest import ARTICLE_SIZES, record_throughput
+
+
+@pytest.mark.parametrize("count", ARTICLE_SIZES)
+def test_sentiment_predict_one(benchmark, sentiment_agent, count):
+    articles = synthetic.make_articles(count)
+
+    results = benchmark(lambda: [sentiment_agent.predict_one(a) for a in articles])
+
+    assert len(results) == count
+    record_throughput(benchmark, count, "articles")
+
+
+@pytest.mark.parametrize("count", ARTICLE_SIZES)
+def test_sentiment_predict_batch(benchmark, sentiment_agent, count):
+    articles = synthetic.make_articles(count)
+
+    results = benchmark(sentiment_agent.predict_batch, articles)
+
+    assert len(results) == count
+    record_throughput(benchmark, count, "articles")
+
+
+def test_topic_classifier(benchmark):
+    from agents.topic_classifier_agent import TopicClassifier
+
+    classifier = TopicClassifier()
+    topic = benchmark(classifier.classify, "What is NVIDIA's pricing strategy for their new graphics cards?")
+
+    assert topic == "corporate_business"
+    record_throughput(benchmark, 1, "queries")
+
+
+@pytest.mark.parametrize("count", ARTICLE_SIZES)
+def test_evaluator(benchmark, evaluator, count):
+    news = synthetic.make_articles(count)
+    past = [{"question": "How is AAPL doing?", "answer": "AAPL shares rose after earnings."}]
+    response = "AAPL shares rose on strong services growth. Revenue beat estimates. Guidance held steady."
+
+    result = benchmark(evaluator.evaluate_response, "How are AAPL shares doing?", news, past, response)
+
+    assert 0 <= result["dimension_scores"]["completeness"] <= 100
+    record_throughput(benchmark, 1, "evaluations")
+
+
+@pytest.mark.parametrize("count", ARTICLE_SIZES)
+def test_specialist_respond(benchmark, specialists, count):
+    news = synthetic.make_articles(count)
+    specialist = specialists["markets_trading"]
+
+    answer, prompt = benchmark.pedantic(
+        specialist.respond,
+        kwargs=dict(query="How are AAPL shares doing?", news_summaries=news, past_queries=[], SA_label="positive"),
+        rounds=3,
+        iterations=1,
+    )
+
+    assert "How are AAPL shares doing?" in prompt
+    record_throughput(benchmark, 1, "responses")
@@ -0,0 +1,45 @@
+import pytest
+
+from conftest import record_throughput
+from pipeline import StageTimer, run_pipeline
+
+QUERY = "What is NVIDIA's pricing strategy for their new graphics cards?"
+
+
+@pytest.mark.parametrize("entries", [10, 1000])
+@pytest.mark.parametrize("limit", [3, 16])
+def test_pipeline_end_to_end(benchmark, news_agent, sentiment_agent, evaluator, specialists, history_factory, limit, entries):
+    agents = {"news": news_agent, "sentiment": sentiment_agent, "evaluator": evaluator, "specialists": specialists}
+    history_path = history_factory(entries)
+    timer = StageTimer()
+    rounds = 2
+
+    answer, score = benchmark.pedantic(
+        run_pipeline,
+        args=(QUERY, agents, history_path),
+        kwargs=dict(limit=limit, timer=timer),
+        rounds=rounds,
+        iterations=1,
+    )
+
+    assert isinstance(answer, str)
+    assert 0 <= score <= 100
+    for stage, seconds in timer.timings.items():
+        benchmark.extra_info[f"{stage}_ms"] = round(seconds / rounds * 1000, 2)
+    record_throughput(benchmark, 1, "queries")
+
+
+def test_pipeline_repeat_query_reuses_index(news_agent, sentiment_agent, evaluator, specialists, history_factory):
+    from memory.sentiment_index import SentimentIndex
+
+    agents = {"news": news_agent, "sentiment": sentiment_agent, "evaluator": evaluator, "specialists": specialists, "sentiment_index": SentimentIndex()}
+    history_path = history_factory(10)
+
+    run_pipeline(QUERY, agents, history_path)
+    indexed = agents["sentiment_index"].current("NVDA")
+    # Every article is already indexed now, so the second run scores an empty list.
+    answer, score = run_pipeline(QUERY, agents, history_path)
+
+    assert isinstance(answer, str)
+    assert agents["sentiment_index"].current("NVDA").distribution == indexed.distribution
+    assert sentiment_agent.predict_batch([]) == []
@@ -0,0 +1,35 @@
+import pytest
+
+from conftest import ARTICLE_SIZES, record_throughput
+
+
+def test_ticker_lookup(benchmark, offline):
+    from utils.ticker_finder import get_ticker_from_company_name
+
+    ticker = benchmark(get_ticker_from_company_name, "nvidia")
+
+    assert ticker == "NVDA"
+    record_throughput(benchmark, 1, "lookups")
+
+
+@pytest.mark.parametrize("source", ["yahoo_finance", "news_api"])
+@pytest.mark.parametrize("limit", ARTICLE_SIZES)
+def test_get_news_per_source(benchmark, news_agent, offline, source, limit):
+    offline.yahoo_news_count = limit
+
+    articles = benchmark(news_agent.get_news, "apple", source, limit_per_source=limit, days_back=7)
+
+    assert len(articles) == limit
+    record_throughput(benchmark, len(articles), "articles")
+
+
+@pytest.mark.parametrize("limit", ARTICLE_SIZES)
+def test_get_news_json_all_companies(benchmark, news_agent, offline, limit):
+    from pipeline import COMPANIES
+
+    offline.yahoo_news_count = limit
+
+    result = benchmark(news_agent.get_news_json, company_names=COMPANIES, limit_per_source=limit, days_back=7)
+
+    assert set(result["data"]) == {"AAPL", "MSFT", "GOOGL", "TSLA", "NVDA", "INTC"}
+    record_throughput(benchmark, sum(len(d["articles"]) for d in result["data"].values()), "articles")
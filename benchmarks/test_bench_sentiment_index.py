@@ -0,0 +1,99 @@
+import random
+
+import pytest
+
+import synthetic
+from conftest import record_throughput
+
+UPDATE_SIZES = [100, 1000, 10000]
+START = 1760918400.0  # 2025-10-20T00:00:00Z
+HOUR = 3600.0
+
+
+def _random_updates(count, seed=0):
+    rng = random.Random(seed)
+    updates = []
+    for i in range(count):
+        probs = [rng.random() for _ in range(3)]
+        total = sum(probs)
+        distribution = dict(zip(("negative", "neutral", "positive"), (p / total for p in probs)))
+        # Mostly in order, with some late arrivals up to two days old.
+        timestamp = START + i * 60
+        if rng.random() < 0.1:
+            timestamp -= rng.random() * 48 * HOUR
+        updates.append((rng.choice(synthetic.TICKERS), distribution, timestamp, i))
+    return updates
+
+
+def _filled_index(count):
+    from memory.sentiment_index import SentimentIndex
+
+    index = SentimentIndex(half_life_hours=24)
+    for ticker, distribution, timestamp, key in _random_updates(count):
+        index.update(ticker, distribution, timestamp, key=key)
+    return index
+
+
+@pytest.mark.parametrize("count", UPDATE_SIZES)
+def test_index_update(benchmark, count):
+    from memory.sentiment_index import SentimentIndex
+
+    updates = _random_updates(count)
+
+    def build():
+        index = SentimentIndex(half_life_hours=24)
+        for ticker, distribution, timestamp, key in updates:
+            index.update(ticker, distribution, timestamp, key=key)
+        return index
+
+    index = benchmark.pedantic(build, rounds=3, iterations=1)
+
+    assert len(index.history("AAPL")["time"]) > 0
+    record_throughput(benchmark, count, "updates")
+
+
+@pytest.mark.parametrize("count", UPDATE_SIZES)
+def test_index_current(benchmark, count):
+    index = _filled_index(count)
+
+    reading = benchmark(index.current, "AAPL", START + count * 60)
+
+    assert reading.label in ("negative", "neutral", "positive")
+    record_throughput(benchmark, 1, "queries")
+
+
+@pytest.mark.parametrize("count", UPDATE_SIZES)
+def test_index_trend(benchmark, count):
+    index = _filled_index(count)
+
+    delta = benchmark(index.trend, "AAPL", START + count * 30)
+
+    assert -1.0 <= delta <= 1.0
+    record_throughput(benchmark, 1, "queries")
+
+
+def test_index_decay_and_dedup(tmp_path):
+    from memory.sentiment_index import SentimentIndex
+
+    index = SentimentIndex(half_life_hours=24)
+    positive = {"negative": 0.05, "neutral": 0.05, "positive": 0.9}
+    negative = {"negative": 0.9, "neutral": 0.05, "positive": 0.05}
+
+    assert index.update("AAPL", positive, "2025-10-18T00:00:00Z", key=1)
+    assert not index.update("AAPL", positive, "2025-10-18T00:00:00Z", key=1)
+    assert index.update("AAPL", negative, "2025-10-20T00:00:00Z", key=2)
+    assert index.current("AAPL").label == "negative"
+
+    # An old article arriving late barely moves the aggregate.
+    index.update("AAPL", positive, "2025-10-10T00:00:00Z", key=3)
+    assert index.current("AAPL").label == "negative"
+    assert index.trend("AAPL", "2025-10-19T00:00:00Z") < 0
+    assert index.trend("AAPL", None) < 0
+    with pytest.raises(ValueError):
+        index.trend("AAPL", "last week")
+
+    restored = SentimentIndex.load(index.save(str(tmp_path / "index.npz")))
+    now = index.current("AAPL").as_of
+    assert restored.current("AAPL", now) == index.current("AAPL", now)
+    assert not restored.update("AAPL", positive, "2025-10-18T00:00:00Z", key=1)
+    assert len(restored.history("AAPL")["time"]) == 3
@@ -0,0 +1,37 @@
+import json
+import os
+import subprocess
+import sys
+
+from conftest import BENCH_DIR
+
+SRC_DIR = os.path.abspath(os.path.join(BENCH_DIR, "..", "src"))
+HEAVY_MODULES = ["torch", "transformers", "sentence_transformers", "yfinance", "pandas", "nltk"]
+
+IMPORT_AGENTS = f"""
+import json, sys, time
+sys.path.insert(0, {SRC_DIR!r})
+start = time.perf_counter()
+from utils.ticker_finder import get_ticker_from_company_name
+from utils.model_server import RemoteSentimentAnalysisAgent, RemoteEvaluatorOptimizer, RemoteSpecialist
+from memory.memory_agent import MemoryAgent
+from agents.topic_classifier_agent import TopicClassifier
+from agents.news_retrieval_agent import NewsRetrievalAgent
+from agents.sentiment_analysis_agent import SentimentAnalysisAgent
+from agents.specialist_agent import Specialist
+from agents.evaluator_optimizer_agent import EvaluatorOptimizer
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))
+"""
+
+
+def _import_agents():
+    out = subprocess.run([sys.executable, "-c", IMPORT_AGENTS], capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def test_agent_imports_are_lazy(benchmark):
+    result = benchmark.pedantic(_import_agents, rounds=3, iterations=1)
+
+    assert result["loaded"] == []
+    benchmark.extra_info["import_ms"] = round(result["seconds"] * 1000, 2)
@@ -0,0 +1,58 @@
+import pytest
+
+from conftest import ARTICLE_SIZES, record_throughput
+from pipeline import COMPANIES
+
+
+@pytest.mark.parametrize("limit", ARTICLE_SIZES)
+def test_get_news_json_replay(benchmark, news_agent_factory, offline, tmp_path, limit):
+    cassette = str(tmp_path / "http.jsonl.gz")
+    offline.yahoo_news_count = limit
+    recorded = news_agent_factory("record", cassette).get_news_json(COMPANIES, limit_per_source=limit, days_back=7)
+
+    agent = news_agent_factory("replay", cassette)
+    requests_before = offline.request_count
+    result = benchmark(agent.get_news_json, COMPANIES, limit_per_source=limit, days_back=7)
+
+    assert offline.request_count == requests_before
+    assert result["data"] == recorded["data"]
+    record_throughput(benchmark, sum(len(d["articles"]) for d in result["data"].values()), "articles")
+
+
+def test_replay_miss_is_not_swallowed(news_agent_factory, offline, tmp_path):
+    from utils.http_transport import CassetteMiss, HTTPTransport
+    from utils.ticker_finder import get_ticker_from_company_name
+
+    cassette = str(tmp_path / "empty.jsonl.gz")
+    with pytest.raises(CassetteMiss):
+        get_ticker_from_company_name("apple", transport=HTTPTransport("replay", cassette))
+
+    # Ticker lookup recorded, news not: the agent must not turn the miss into "no articles".
+    recorder = news_agent_factory("record", cassette)
+    recorder.find_ticker("apple")
+    with pytest.raises(CassetteMiss):
+        news_agent_factory("replay", cassette).get_news("apple", "yahoo_finance", limit_per_source=1)
+
+
+def test_record_writes_each_response_once(news_agent_factory, offline, tmp_path):
+    import gzip
+
+    from utils.http_transport import CassetteMiss, HTTPTransport
+
+    cassette = str(tmp_path / "http.jsonl.gz")
+    agent = news_agent_factory("record", cassette)
+    agent.get_news("apple", None, limit_per_source=20)
+    agent.get_news_json(["apple"], limit_per_source=20)
+
+    with gzip.open(cassette, "rt", encoding="utf-8") as f:
+        lines = [line for line in f if line.strip()]
+    assert len(lines) == len(agent.transport.store)
+
+    # Failed responses are passed through but never recorded.
+    transport = HTTPTransport("record", cassette)
+    assert transport.get(f"{offline.base_url}/missing").status_code == 404
+    with pytest.raises(CassetteMiss):
+        HTTPTransport("replay", cassette).get(f"{offline.base_url}/missing")
+
+    agent.transport.store.compact()
+    assert len(HTTPTransport("replay", cassette).store) == len(lines)
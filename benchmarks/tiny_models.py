@@ -0,0 +1,110 @@
+import os
+import re
+import string
+
+import torch
+from tokenizers import Tokenizer, decoders, pre_tokenizers
+from tokenizers.models import Unigram
+from transformers import (
+    BertConfig,
+    BertForSequenceClassification,
+    BertModel,
+    BertTokenizer,
+    PreTrainedTokenizerFast,
+    T5Config,
+    T5ForConditionalGeneration,
+)
+from sentence_transformers import SentenceTransformer, models
+
+TOPICS = ["markets_trading", "corporate_business", "crypto_digital_assets"]
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+# Shapes are kept tiny on purpose: the suite measures the code around the models
+# (tokenisation, batching, pooling, generation loops), not the real weights.
+BERT_SHAPE = dict(hidden_size=32, num_hidden_layers=2, num_attention_heads=2, intermediate_size=64, max_position_embeddings=512)
+T5_SHAPE = dict(d_model=32, d_ff=64, d_kv=16, num_layers=2, num_decoder_layers=2, num_heads=2)
+
+
+def _corpus_words(corpus):
+    words = set()
+    for text in corpus:
+        words.update(_WORD.findall(text.lower()))
+    return sorted(words)
+
+
+def _build_bert_vocab(path, corpus):
+    chars = list(string.ascii_lowercase + string.digits + string.punctuation)
+    vocab = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"]
+    vocab += chars + [f"##{c}" for c in string.ascii_lowercase + string.digits]
+    vocab += [w for w in _corpus_words(corpus) if w not in vocab]
+    with open(path, "w") as f:
+        f.write("\n".join(vocab))
+    return len(vocab)
+
+
+def _build_t5_tokenizer(corpus):
+    pieces = [("<pad>", 0.0), ("</s>", 0.0), ("<unk>", 0.0), ("▁", -2.0)]
+    pieces += [(c, -5.0) for c in string.ascii_letters + string.digits + string.punctuation]
+    pieces += [(f"▁{w}", -1.0) for w in _corpus_words(corpus)]
+    backend = Tokenizer(Unigram(pieces, unk_id=2, byte_fallback=False))
+    backend.pre_tokenizer = pre_tokenizers.Metaspace(replacement="▁", prepend_scheme="always")
+    backend.decoder = decoders.Metaspace(replacement="▁", prepend_scheme="always")
+    return PreTrainedTokenizerFast(tokenizer_object=backend, pad_token="<pad>", eos_token="</s>", unk_token="<unk>")
+
+
+def build_finbert(path, corpus):
+    """Randomly initialised BERT classifier with the finbert-tone label set."""
+    os.makedirs(path, exist_ok=True)
+    vocab_size = _build_bert_vocab(os.path.join(path, "vocab.txt"), corpus)
+    config = BertConfig(
+        vocab_size=vocab_size,
+        id2label={0: "Neutral", 1: "Positive", 2: "Negative"},
+        label2id={"Neutral": 0, "Positive": 1, "Negative": 2},
+        **BERT_SHAPE,
+    )
+    BertForSequenceClassification(config).save_pretrained(path)
+    BertTokenizer(os.path.join(path, "vocab.txt")).save_pretrained(path)
+    return path
+
+
+def build_minilm(path, corpus):
+    """Randomly initialised BERT encoder wrapped as a mean-pooling SentenceTransformer."""
+    encoder_path = os.path.join(path, "encoder")
+    os.makedirs(encoder_path, exist_ok=True)
+    vocab_size = _build_bert_vocab(os.path.join(encoder_path, "vocab.txt"), corpus)
+    BertModel(BertConfig(vocab_size=vocab_size, **BERT_SHAPE)).save_pretrained(encoder_path)
+    BertTokenizer(os.path.join(encoder_path, "vocab.txt")).save_pretrained(encoder_path)
+
+    word_embedding = models.Transformer(encoder_path, max_seq_length=256)
+    pooling = models.Pooling(BERT_SHAPE["hidden_size"])
+    model_path = os.path.join(path, "sentence-transformer")
+    SentenceTransformer(modules=[word_embedding, pooling], device="cpu").save(model_path)
+    return model_path
+
+
+def build_specialists(base_dir, corpus, topics=TOPICS):
+    """Randomly initialised T5 generators laid out like `specialized_agents/<topic>-generator`."""
+    tokenizer = _build_t5_tokenizer(corpus)
+    config = T5Config(
+        vocab_size=len(tokenizer),
+        pad_token_id=tokenizer.pad_token_id,
+        eos_token_id=tokenizer.eos_token_id,
+        decoder_start_token_id=tokenizer.pad_token_id,
+        **T5_SHAPE,
+    )
+    for topic in topics:
+        path = os.path.join(base_dir, f"{topic}-generator")
+        torch.manual_seed(len(topic))
+        T5ForConditionalGeneration(config).save_pretrained(path)
+        tokenizer.save_pretrained(path)
+    return base_dir
+
+
+def build_all(root, corpus):
+    torch.manual_seed(42)
+    return {
+        "finbert": build_finbert(os.path.join(root, "finbert"), corpus),
+        "minilm": build_minilm(os.path.join(root, "minilm"), corpus),
+        "specialists": build_specialists(os.path.join(root, "specialized_agents"), corpus),
+    }
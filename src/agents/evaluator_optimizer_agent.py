@@ -1,19 +1,30 @@
-import torch
-from sentence_transformers import SentenceTransformer, util
-import numpy as np
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.lazy_import import lazy_import
+
+np = lazy_import("numpy")
+torch = lazy_import("torch")
 
 class EvaluatorOptimizer:
 
-    def __init__(self, model_name="all-MiniLM-L6-v2"):
+    def __init__(self, model_name="all-MiniLM-L6-v2", model=None):
         
-        self.model = SentenceTransformer(model_name)
-        if torch.cuda.is_available():
-            self.model = self.model.to("cuda")
+        if model is not None:
+            self.model = model
+        else:
+            from sentence_transformers import SentenceTransformer
+            self.model = SentenceTransformer(model_name)
+            if torch.cuda.is_available():
+                self.model = self.model.to("cuda")
 
         self.evaluation_criteria = ["relevance", "accuracy", "completeness", "context_usage", "clarity"]
 
     def evaluate_response(self, original_query, news_summaries, past_queries, specialist_response):
 
+        from sentence_transformers import util
         query_emb = self.model.encode(original_query, convert_to_tensor=True)
         response_emb = self.model.encode(specialist_response, convert_to_tensor=True)
         relevance_score = util.pytorch_cos_sim(response_emb, query_emb).item()
@@ -1,38 +1,45 @@
 import os
 import sys
 import json
-import requests
-import pandas as pd
-import yfinance as yf
 from dotenv import load_dotenv
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
+from utils.http_transport import CassetteMiss, get_transport
+from utils.lazy_import import lazy_import
+from memory.news_archive import NewsArchive
+
+pd = lazy_import("pandas")
+yf = lazy_import("yfinance")
+
 try:
     from utils.ticker_finder import get_ticker_from_company_name
 except ImportError as e:
-    def get_ticker_from_company_name(company_name):
+    def get_ticker_from_company_name(company_name, transport=None):
         return None
 
 load_dotenv()
 
 class NewsRetrievalAgent:
     
-    def __init__(self):
+    def __init__(self, transport=None, archive=None):
+        self.transport = transport or get_transport()
+        self.archive = archive
         self.available_sources = ['yahoo_finance', 'news_api']
         self.news_api_key = os.getenv('NEWS_API_KEY')
-        self.news_api_base_url = "https://newsapi.org/v2/everything"
+        self.news_api_base_url = os.getenv("NEWS_API_BASE_URL", "https://newsapi.org/v2/everything")
     
     def find_ticker(self, company_name):
-        ticker = get_ticker_from_company_name(company_name)
+        ticker = get_ticker_from_company_name(company_name, transport=self.transport)
         return ticker
     
     def get_company_name(self, ticker):
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            info = self.transport.fetch(f"yfinance/info/{ticker}", lambda: yf.Ticker(ticker).info)
             return info.get('longName', info.get('shortName', ticker))
+        except CassetteMiss:
+            raise
         except:
             return ticker
     
@@ -55,11 +62,18 @@ class NewsRetrievalAgent:
                     articles = self._fetch_from_source(ticker, src, limit_per_source, days_back)
                     all_articles.extend(articles)
                 articles = self._remove_duplicates(all_articles)
-            
-            return articles
                 
+        except CassetteMiss:
+            raise
         except Exception as e:
             return []
+        
+        if self.archive is not None:
+            try:
+                self.archive.append(articles)
+            except Exception as e:
+                print(f"News archive error: {e}")
+        return articles
     
     def get_news_json(self, company_names, source=None, limit_per_source=50, days_back=30):
         
@@ -105,11 +119,27 @@ class NewsRetrievalAgent:
         else:
             return ""
     
-    def get_news_dataframe(self, company_name, source, limit_per_source=50, days_back=30):
+    def get_news_dataframe(self, company_name, source, limit_per_source=50, days_back=30, from_archive=False, columns=None):
         
+        if from_archive:
+            return self._read_archive(company_name, source, days_back, columns)
         articles = self.get_news(company_name, source, limit_per_source, days_back)
         return pd.DataFrame(articles)
     
+    def _read_archive(self, company_name, source, days_back, columns=None):
+        
+        # Without an archive of its own the agent reads the default one in data/archive/.
+        archive = self.archive if self.archive is not None else NewsArchive()
+        
+        # Tickers already in the archive are used as-is, so offline reads need no lookup.
+        ticker = company_name.upper() if company_name.upper() in archive.tickers() else self.find_ticker(company_name)
+        if not ticker:
+            return pd.DataFrame(columns=columns)
+        
+        start = datetime.now(timezone.utc) - timedelta(days=days_back) if days_back else None
+        table = archive.read(tickers=ticker, start=start, source=source, columns=columns)
+        return table.to_pandas()
+    
     def _fetch_from_source(self, ticker, source, limit, days_back):
         
         if source == 'yahoo_finance':
@@ -133,8 +163,7 @@ class NewsRetrievalAgent:
     def _get_yahoo_news(self, ticker, limit):
         
         try:
-            stock = yf.Ticker(ticker)
-            news = stock.news
+            news = self.transport.fetch(f"yfinance/news/{ticker}", lambda: yf.Ticker(ticker).news)
             
             if not news:
                 return []
@@ -172,6 +201,8 @@ class NewsRetrievalAgent:
                 
             return articles
             
+        except CassetteMiss:
+            raise
         except Exception as e:
             print(f"Yahoo Finance error: {e}")
             return []
@@ -197,7 +228,7 @@ class NewsRetrievalAgent:
                 'apiKey': self.news_api_key
             }
             
-            response = requests.get(self.news_api_base_url, params=params)
+            response = self.transport.get(self.news_api_base_url, params=params)
             
             if response.status_code == 200:
                 data = response.json()
@@ -220,12 +251,14 @@ class NewsRetrievalAgent:
             else:
                 return []
                 
+        except CassetteMiss:
+            raise
         except Exception as e:
             return []
 
 
 def test_agent(show_json=True, save_csv=False):
-    agent = NewsRetrievalAgent()
+    agent = NewsRetrievalAgent(archive=NewsArchive())
     
     print("\n🚀 Testing News Retrieval Agent")
     print("=" * 60)
@@ -1,15 +1,15 @@
 import re
 import os
-import nltk
-import torch
+import sys
 from dataclasses import dataclass
 from typing import Literal, Optional, List, Dict
-from transformers import AutoTokenizer, AutoModelForSequenceClassification, TextClassificationPipeline
-try:
-    from nltk.sentiment import SentimentIntensityAnalyzer
-except LookupError:
-    nltk.download('vader_lexicon')
-from nltk.sentiment import SentimentIntensityAnalyzer
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.lazy_import import lazy_import
+
+nltk = lazy_import("nltk")
+torch = lazy_import("torch")
 
 Label = Literal["positive", "negative", "neutral"]
 
@@ -35,12 +35,13 @@ class _HFBackend:
             torch.manual_seed(42)
         except Exception:
             pass
+        from transformers import AutoTokenizer, AutoModelForSequenceClassification, TextClassificationPipeline
         self.tokenizer = AutoTokenizer.from_pretrained(model_name)
         self.model = AutoModelForSequenceClassification.from_pretrained(model_name)
         self.pipe = TextClassificationPipeline(model=self.model, tokenizer=self.tokenizer, top_k=None, truncation=True)
 
-    def predict(self, texts):
-        outputs = self.pipe(texts)
+    def predict(self, texts, batch_size=None):
+        outputs = self.pipe(texts, batch_size=batch_size) if batch_size else self.pipe(texts)
         results: List[SentimentResult] = []
         for scores in outputs:
             dist_map: Dict[Label, float] = {"negative": 0.0, "neutral": 0.0, "positive": 0.0}
@@ -56,7 +57,12 @@ class _HFBackend:
 class _VADERBackend:
     
     def __init__(self):
-        self.analyzer = SentimentIntensityAnalyzer()
+        from nltk.sentiment import SentimentIntensityAnalyzer
+        try:
+            self.analyzer = SentimentIntensityAnalyzer()
+        except LookupError:
+            nltk.download('vader_lexicon')
+            self.analyzer = SentimentIntensityAnalyzer()
 
     def predict(self, texts):
         return [self._score_one(t) for t in texts]
@@ -74,9 +80,12 @@ class _VADERBackend:
 
 class SentimentAnalysisAgent:
     
-    def __init__(self, model_preference=None, model_name=None):
+    def __init__(self, model_preference=None, model_name=None, backend=None):
         self.backend_name = None
-        self.backend = None
+        self.backend = backend
+        if backend is not None:
+            self.backend_name = getattr(backend, "name", type(backend).__name__)
+            return
         pref = (model_preference or os.getenv("SENTIMENT_BACKEND") or "auto").lower()
         if pref in ("transformers", "auto"):
             try:
@@ -112,6 +121,9 @@ class SentimentAnalysisAgent:
         )
 
     def predict_batch(self, texts, *, ids=None):
+        # The transformers pipeline raises on an empty list (e.g. every article already indexed).
+        if not texts:
+            return []
         texts = [clean_text(t) for t in texts]
         raw = self.backend.predict(texts)
         out: List[SentimentResult] = []
@@ -1,12 +1,23 @@
-from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
-import torch
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.lazy_import import lazy_import
+
+torch = lazy_import("torch")
 
 class Specialist:
-    def __init__(self, topic, base_dir="../agents/specialized_agents"):
+    def __init__(self, topic, base_dir="../agents/specialized_agents", generator=None):
         self.topic = topic
         self.model_path = f"{base_dir}/{topic}-generator"
+        # A generator (e.g. from utils.model_pool) runs the model elsewhere; nothing is loaded here.
+        self.generator = generator
+        if generator is not None:
+            return
         print(f"Loading model for topic: {topic} from {self.model_path}")
         
+        from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
         self.tokenizer = AutoTokenizer.from_pretrained(self.model_path, use_fast=False)
         self.model = AutoModelForSeq2SeqLM.from_pretrained(self.model_path)
         self.model.eval()
@@ -38,10 +49,16 @@ Instruction:
     Do NOT repeat past answers verbatim.
     Use past queries only as supporting information.."""
         
-        inputs = self.tokenizer(prompt, return_tensors="pt", truncation=True, padding="max_length", max_length=1024)
+        if self.generator is not None:
+            answer = self.generator.generate(prompt)
+        else:
+            answer = self.generate([prompt])[0]
+        return answer, prompt
+
+    def generate(self, prompts):
+        inputs = self.tokenizer(prompts, return_tensors="pt", truncation=True, padding="max_length", max_length=1024)
         if torch.cuda.is_available():
             inputs = {k: v.to("cuda") for k, v in inputs.items()}
         
         outputs = self.model.generate(**inputs, max_new_tokens=512)
-        answer = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
-        return answer.strip(), prompt
+        return [self.tokenizer.decode(output, skip_special_tokens=True).strip() for output in outputs]
@@ -0,0 +1,188 @@
+import os
+import sys
+import uuid
+from urllib.parse import unquote
+from datetime import datetime, timezone
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.lazy_import import lazy_import
+
+pa = lazy_import("pyarrow")
+ds = lazy_import("pyarrow.dataset")
+pq = lazy_import("pyarrow.parquet")
+pafs = lazy_import("pyarrow.fs")
+
+DEFAULT_ARCHIVE_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "data", "archive")
+
+ARTICLE_FIELDS = ["title", "publisher", "link", "published_date", "summary", "content", "company_name", "source"]
+PARTITION_FIELDS = ["ticker", "date"]
+
+
+def _schema():
+    return pa.schema(
+        [(name, pa.string()) for name in ARTICLE_FIELDS]
+        + [("published_at", pa.timestamp("us", tz="UTC")), ("retrieved_at", pa.timestamp("us", tz="UTC"))]
+        + [(name, pa.string()) for name in PARTITION_FIELDS]
+    )
+
+
+def _file_schema():
+    schema = _schema()
+    return pa.schema([field for field in schema if field.name not in PARTITION_FIELDS])
+
+
+def _parse_date(value):
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def _dedup_key(article):
+    return article.get('link') or article.get('title') or ''
+
+
+class NewsArchive:
+    """
+    Append-only Parquet archive of retrieved articles, hive-partitioned as
+    `ticker=<TICKER>/date=<YYYY-MM-DD>/part-*.parquet` (date of publication, UTC).
+
+    `append` drops articles whose link (or title, when there is none) is already stored for the ticker.
+    Reads go through pyarrow.dataset: ticker and date filters prune whole partitions,
+    other filters and the column list are pushed down to the Parquet row groups, and
+    files are memory-mapped, so analytics over long periods never load everything.
+    """
+
+    def __init__(self, root=DEFAULT_ARCHIVE_DIR, memory_map=True):
+        self.root = os.path.abspath(root)
+        self.memory_map = memory_map
+        self._keys = {}
+
+    @property
+    def schema(self):
+        return _schema()
+
+    def _stored_keys(self, ticker):
+        # Dedup spans every date of a ticker: undated articles are filed under the retrieval
+        # date and sources disagree on publication times, so one link can map to several days.
+        # Read through the dataset rather than a path: pyarrow URI-encodes partition values,
+        # so an index symbol such as ^GSPC is stored under ticker=%5EGSPC.
+        if ticker not in self._keys:
+            table = self.read(tickers=ticker, columns=["link", "title"])
+            self._keys[ticker] = {_dedup_key(row) for row in table.to_pylist()}
+        return self._keys[ticker]
+
+    def append(self, articles, retrieved_at=None):
+        """Adds retrieval dicts (as returned by NewsRetrievalAgent.get_news); returns how many were new."""
+        retrieved_at = retrieved_at or datetime.now(timezone.utc)
+        rows = {name: [] for name in _schema().names}
+        for article in articles:
+            ticker = article.get('ticker')
+            if not ticker:
+                continue
+            key = _dedup_key(article)
+            stored = self._stored_keys(ticker)
+            if key in stored:
+                continue
+            stored.add(key)
+            published_at = _parse_date(article.get('published_date'))
+            date = (published_at or retrieved_at).astimezone(timezone.utc).strftime("%Y-%m-%d")
+            for name in ARTICLE_FIELDS:
+                value = article.get(name)
+                rows[name].append(None if value is None else str(value))
+            rows["published_at"].append(published_at)
+            rows["retrieved_at"].append(retrieved_at)
+            rows["ticker"].append(ticker)
+            rows["date"].append(date)
+
+        added = len(rows["ticker"])
+        if added:
+            table = pa.Table.from_pydict(rows, schema=_schema())
+            ds.write_dataset(
+                table,
+                self.root,
+                format="parquet",
+                partitioning=self._partitioning(),
+                basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+                existing_data_behavior="overwrite_or_ignore",
+            )
+        return added
+
+    def _partitioning(self):
+        return ds.partitioning(pa.schema([(name, pa.string()) for name in PARTITION_FIELDS]), flavor="hive")
+
+    def dataset(self):
+        filesystem = pafs.LocalFileSystem(use_mmap=self.memory_map)
+        return ds.dataset(self.root, format="parquet", partitioning=self._partitioning(), filesystem=filesystem, schema=_schema())
+
+    def _filter(self, tickers=None, start=None, end=None, source=None, filter=None):
+        expression = None
+
+        def combine(expr):
+            return expr if expression is None else expression & expr
+
+        if tickers is not None:
+            expression = combine(ds.field("ticker").isin([tickers] if isinstance(tickers, str) else list(tickers)))
+        # The `date` test prunes whole partitions; the `published_at` test refines within the
+        # boundary days and keeps undated articles, which were partitioned by retrieval date.
+        published_at = ds.field("published_at")
+        if start is not None:
+            start = _parse_date(start) if isinstance(start, str) else start
+            expression = combine(ds.field("date") >= start.astimezone(timezone.utc).strftime("%Y-%m-%d"))
+            expression = combine((published_at >= pa.scalar(start, type=pa.timestamp("us", tz="UTC"))) | published_at.is_null())
+        if end is not None:
+            end = _parse_date(end) if isinstance(end, str) else end
+            expression = combine(ds.field("date") <= end.astimezone(timezone.utc).strftime("%Y-%m-%d"))
+            expression = combine((published_at <= pa.scalar(end, type=pa.timestamp("us", tz="UTC"))) | published_at.is_null())
+        if source is not None:
+            expression = combine(ds.field("source") == source)
+        if filter is not None:
+            expression = combine(filter)
+        return expression
+
+    def scanner(self, tickers=None, start=None, end=None, source=None, columns=None, filter=None, batch_size=64 * 1024):
+        """Scanner over matching rows; iterate `to_batches()` to process months of news in bounded memory."""
+        if not os.path.isdir(self.root):
+            os.makedirs(self.root, exist_ok=True)
+        return self.dataset().scanner(
+            columns=columns,
+            filter=self._filter(tickers, start, end, source, filter),
+            batch_size=batch_size,
+        )
+
+    def read(self, tickers=None, start=None, end=None, source=None, columns=None, filter=None):
+        """Matching rows as a pyarrow Table; `start`/`end` are datetimes or ISO strings on published_at."""
+        return self.scanner(tickers, start, end, source, columns, filter).to_table()
+
+    def to_pandas(self, **kwargs):
+        return self.read(**kwargs).to_pandas()
+
+    def _ticker_dirs(self):
+        if not os.path.isdir(self.root):
+            return {}
+        return {unquote(name.split("=", 1)[1]): os.path.join(self.root, name) for name in os.listdir(self.root) if name.startswith("ticker=")}
+
+    def tickers(self):
+        return sorted(self._ticker_dirs())
+
+    def compact(self, tickers=None):
+        """Rewrites every partition of `tickers` (default: all) into a single file, merging small appends."""
+        ticker_dirs = self._ticker_dirs()
+        for ticker in ([tickers] if isinstance(tickers, str) else tickers) or sorted(ticker_dirs):
+            ticker_dir = ticker_dirs.get(ticker)
+            if ticker_dir is None:
+                continue
+            for name in os.listdir(ticker_dir):
+                path = os.path.join(ticker_dir, name)
+                files = [f for f in os.listdir(path) if f.endswith(".parquet")]
+                if len(files) <= 1:
+                    continue
+                table = pq.read_table(path, schema=_file_schema(), partitioning=None)
+                pq.write_table(table, os.path.join(path, f"part-{uuid.uuid4().hex}-0.parquet"))
+                for f in files:
+                    os.remove(os.path.join(path, f))
+
@@ -0,0 +1,242 @@
+import os
+import sys
+import math
+import time
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.lazy_import import lazy_import
+
+np = lazy_import("numpy")
+
+LABELS = ("negative", "neutral", "positive")
+
+
+@dataclass
+class TickerSentiment:
+    ticker: str
+    label: str
+    score: float
+    distribution: Dict[str, float]
+    weight: float
+    as_of: float
+
+
+def parse_published_date(value, default=None):
+    """ISO-8601 string (with or without Z / offset) to epoch seconds; naive dates are taken as UTC."""
+    if not value:
+        return default
+    try:
+        dt = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return default
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _timestamp(value):
+    return parse_published_date(value) if isinstance(value, str) else value
+
+
+def article_key(article):
+    """Stable 63-bit id of an article: its link, or its title and summary when there is no link."""
+    raw = article.get('link') or f"{article.get('title', '')}\n{article.get('summary', '')}"
+    return int.from_bytes(hashlib.blake2b(raw.encode('utf-8'), digest_size=8).digest(), 'big') >> 1
+
+
+class SentimentIndex:
+    """
+    Per-ticker sentiment aggregate with exponential time decay.
+
+    Each ticker keeps a decayed sum of SentimentResult.distribution vectors referenced at
+    the publication time of its newest article. A new article decays that sum by
+    exp(-ln2 * dt / half_life) and adds its own distribution (an older article is decayed
+    instead), so updates and reads are O(1) and articles are never re-scored. Articles
+    already indexed are recognised by `article_key` and skipped.
+
+    State lives in numpy arrays (one row per ticker) and every update appends a snapshot
+    row to an array-backed history table, which `history` and `trend` read from.
+    """
+
+    def __init__(self, half_life_hours=24.0, path=None, capacity=16):
+        self.half_life_hours = float(half_life_hours)
+        self.path = path
+        self.tickers = {}
+        self._sums = np.zeros((capacity, 3), dtype=np.float64)
+        self._as_of = np.zeros(capacity, dtype=np.float64)
+        self._seen = set()
+        self._hist_size = 0
+        self._hist_ticker = np.zeros(capacity, dtype=np.int32)
+        self._hist_time = np.zeros(capacity, dtype=np.float64)
+        self._hist_dist = np.zeros((capacity, 3), dtype=np.float32)
+        self._hist_weight = np.zeros(capacity, dtype=np.float32)
+
+    @property
+    def decay_rate(self):
+        return math.log(2) / (self.half_life_hours * 3600)
+
+    def _row(self, ticker):
+        row = self.tickers.get(ticker)
+        if row is None:
+            row = len(self.tickers)
+            if row == len(self._as_of):
+                self._sums = np.concatenate([self._sums, np.zeros_like(self._sums)])
+                self._as_of = np.concatenate([self._as_of, np.zeros_like(self._as_of)])
+            self.tickers[ticker] = row
+        return row
+
+    def _append_history(self, row, timestamp, distribution, weight):
+        if self._hist_size == len(self._hist_time):
+            self._hist_ticker = np.concatenate([self._hist_ticker, np.zeros_like(self._hist_ticker)])
+            self._hist_time = np.concatenate([self._hist_time, np.zeros_like(self._hist_time)])
+            self._hist_dist = np.concatenate([self._hist_dist, np.zeros_like(self._hist_dist)])
+            self._hist_weight = np.concatenate([self._hist_weight, np.zeros_like(self._hist_weight)])
+        i = self._hist_size
+        self._hist_ticker[i] = row
+        self._hist_time[i] = timestamp
+        self._hist_dist[i] = distribution
+        self._hist_weight[i] = weight
+        self._hist_size += 1
+
+    def seen(self, ticker, article):
+        return (ticker, article_key(article)) in self._seen
+
+    def update(self, ticker, distribution, published_date=None, key=None):
+        """
+        Adds one scored article. `distribution` is a SentimentResult.distribution mapping,
+        `published_date` an ISO string or epoch seconds (defaults to now). Returns False when
+        `key` was already indexed for this ticker.
+        """
+        if key is not None:
+            if (ticker, key) in self._seen:
+                return False
+            self._seen.add((ticker, key))
+
+        if isinstance(published_date, (int, float)):
+            timestamp = float(published_date)
+        else:
+            timestamp = parse_published_date(published_date, default=time.time())
+        vector = np.array([float(distribution.get(label, 0.0)) for label in LABELS])
+        if vector.sum() <= 0.0:
+            vector = np.array([0.0, 1.0, 0.0])
+
+        row = self._row(ticker)
+        weight = self._sums[row].sum()
+        if weight == 0.0 or timestamp >= self._as_of[row]:
+            if weight > 0.0:
+                self._sums[row] *= math.exp(-self.decay_rate * (timestamp - self._as_of[row]))
+            self._sums[row] += vector
+            self._as_of[row] = timestamp
+        else:
+            self._sums[row] += vector * math.exp(-self.decay_rate * (self._as_of[row] - timestamp))
+
+        total = self._sums[row].sum()
+        self._append_history(row, self._as_of[row], self._sums[row] / total, total)
+        return True
+
+    def update_articles(self, ticker, articles, results):
+        """Indexes `articles` (retrieval dicts) with their SentimentResults; returns how many were new."""
+        added = 0
+        for article, result in zip(articles, results):
+            added += self.update(ticker, result.distribution, article.get('published_date'), key=article_key(article))
+        return added
+
+    def current(self, ticker, now=None) -> Optional[TickerSentiment]:
+        """Current label, score and distribution of `ticker`, or None if nothing was indexed for it."""
+        row = self.tickers.get(ticker)
+        if row is None:
+            return None
+        sums = self._sums[row]
+        total = sums.sum()
+        now = time.time() if now is None else now
+        weight = total * math.exp(-self.decay_rate * max(0.0, now - self._as_of[row]))
+        distribution = {label: float(v) for label, v in zip(LABELS, sums / total)}
+        label = max(distribution, key=distribution.get)
+        return TickerSentiment(ticker, label, distribution[label], distribution, float(weight), float(self._as_of[row]))
+
+    def history(self, ticker, start=None, end=None):
+        """Snapshots of `ticker` after each update: dict of `time`, `distribution` (n x 3, LABELS order) and `weight` arrays."""
+        row = self.tickers.get(ticker)
+        start, end = _timestamp(start), _timestamp(end)
+        n = self._hist_size
+        mask = self._hist_ticker[:n] == (row if row is not None else -1)
+        times = self._hist_time[:n]
+        if start is not None:
+            mask &= times >= start
+        if end is not None:
+            mask &= times <= end
+        return {
+            "time": times[mask],
+            "distribution": self._hist_dist[:n][mask],
+            "weight": self._hist_weight[:n][mask],
+        }
+
+    def trend(self, ticker, since):
+        """
+        Change of the net score (positive - negative) from the last snapshot before `since`
+        (epoch seconds or ISO string; None means the first snapshot) to the latest one;
+        positive means sentiment improved.
+        """
+        timestamp = _timestamp(since)
+        if since is not None and timestamp is None:
+            raise ValueError(f"since must be epoch seconds or an ISO-8601 date, got {since!r}")
+        snapshots = self.history(ticker)
+        if len(snapshots["time"]) == 0:
+            return 0.0
+        net = snapshots["distribution"][:, 2] - snapshots["distribution"][:, 0]
+        if timestamp is None:
+            return float(net[-1] - net[0])
+        before = np.searchsorted(snapshots["time"], timestamp, side="left") - 1
+        baseline = net[before] if before >= 0 else 0.0
+        return float(net[-1] - baseline)
+
+    def save(self, path=None):
+        path = path or self.path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        n, seen = self._hist_size, sorted(self._seen)
+        tickers = sorted(self.tickers, key=self.tickers.get)
+        with open(path, "wb") as f:
+            np.savez_compressed(
+                f,
+                half_life_hours=np.array(self.half_life_hours),
+                tickers=np.array(tickers, dtype=str),
+                sums=self._sums[:len(tickers)],
+                as_of=self._as_of[:len(tickers)],
+                seen_ticker=np.array([self.tickers[t] for t, _ in seen], dtype=np.int32),
+                seen_key=np.array([k for _, k in seen], dtype=np.int64),
+                hist_ticker=self._hist_ticker[:n],
+                hist_time=self._hist_time[:n],
+                hist_dist=self._hist_dist[:n],
+                hist_weight=self._hist_weight[:n],
+            )
+        return path
+
+    @classmethod
+    def load(cls, path):
+        data = np.load(path)
+        index = cls(half_life_hours=float(data["half_life_hours"]), path=path, capacity=max(16, len(data["tickers"])))
+        for ticker in data["tickers"]:
+            index._row(str(ticker))
+        n_tickers = len(index.tickers)
+        index._sums[:n_tickers] = data["sums"]
+        index._as_of[:n_tickers] = data["as_of"]
+        names = [str(t) for t in data["tickers"]]
+        index._seen = {(names[t], int(k)) for t, k in zip(data["seen_ticker"], data["seen_key"])}
+        n = len(data["hist_time"])
+        index._hist_ticker = np.concatenate([data["hist_ticker"], np.zeros(max(16, n), dtype=np.int32)])
+        index._hist_time = np.concatenate([data["hist_time"], np.zeros(max(16, n))])
+        index._hist_dist = np.concatenate([data["hist_dist"], np.zeros((max(16, n), 3), dtype=np.float32)])
+        index._hist_weight = np.concatenate([data["hist_weight"], np.zeros(max(16, n), dtype=np.float32)])
+        index._hist_size = n
+        return index
+
+    @classmethod
+    def load_or_create(cls, path, half_life_hours=24.0):
+        if os.path.exists(path):
+            return cls.load(path)
+        return cls(half_life_hours=half_life_hours, path=path)
@@ -0,0 +1,165 @@
+import os
+import gzip
+import json
+import hashlib
+import threading
+import requests
+
+MODES = ("live", "record", "replay")
+
+DEFAULT_CASSETTE_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "data", "cassettes", "http.jsonl.gz")
+
+# Secrets must never reach the cassette and date windows computed from `now` would
+# make yesterday's recording miss today, so both are left out of the request key.
+IGNORED_PARAMS = {"apiKey", "from"}
+
+
+class CassetteMiss(KeyError):
+    pass
+
+
+class TransportResponse:
+
+    def __init__(self, status_code, text):
+        self.status_code = status_code
+        self.text = text
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class CassetteStore:
+    """
+    Append-only, gzip-compressed JSON-lines file of recorded responses.
+
+    Each line is {"key", "status", "text"}; appending writes a new gzip member so recording
+    never rewrites the file, and a response identical to the stored one is not written again.
+    The whole store is read into a dict on first lookup and later lookups are plain dict hits.
+    When a key was recorded twice the last line wins; `compact` drops the superseded lines.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._entries = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        entries = {}
+        if os.path.exists(self.path):
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        entries[record["key"]] = (record["status"], record["text"])
+        return entries
+
+    def _loaded(self):
+        if self._entries is None:
+            with self._lock:
+                if self._entries is None:
+                    self._entries = self._load()
+        return self._entries
+
+    def get(self, key):
+        entries = self._loaded()
+        if key not in entries:
+            raise CassetteMiss(key)
+        return entries[key]
+
+    def put(self, key, status, text):
+        """Appends a recording; returns False without writing when the same response is already stored."""
+        entries = self._loaded()
+        line = json.dumps({"key": key, "status": status, "text": text}, ensure_ascii=False)
+        with self._lock:
+            if entries.get(key) == (status, text):
+                return False
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with gzip.open(self.path, "at", encoding="utf-8") as f:
+                f.write(line + "\n")
+            entries[key] = (status, text)
+            return True
+
+    def compact(self):
+        """Rewrites the file as a single gzip member holding only the latest recording of each key."""
+        entries = self._loaded()
+        with self._lock:
+            tmp_path = self.path + ".tmp"
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                for key, (status, text) in entries.items():
+                    f.write(json.dumps({"key": key, "status": status, "text": text}, ensure_ascii=False) + "\n")
+            os.replace(tmp_path, self.path)
+
+    def __len__(self):
+        return len(self._loaded())
+
+
+def request_key(method, url, params=None):
+    params = {k: v for k, v in (params or {}).items() if k not in IGNORED_PARAMS}
+    raw = json.dumps([method.upper(), url, sorted((str(k), str(v)) for k, v in params.items())])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class HTTPTransport:
+    """
+    Pluggable network layer for the retrieval code.
+
+    - live: plain `requests.get` and direct library calls
+    - record: same as live, and every new successful response is appended to the cassette store
+    - replay: responses are served from the cassette store, no network at all
+
+    `get` covers raw HTTP calls, `fetch` covers libraries that do their own HTTP
+    (yfinance); the loader result must be JSON serialisable.
+    """
+
+    def __init__(self, mode="live", cassette_path=None):
+        if mode not in MODES:
+            raise ValueError(f"Unknown transport mode '{mode}', expected one of {MODES}")
+        self.mode = mode
+        self.store = CassetteStore(cassette_path or DEFAULT_CASSETTE_PATH) if mode != "live" else None
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        if self.mode == "live":
+            return requests.get(url, params=params, headers=headers, timeout=timeout)
+
+        key = request_key("GET", url, params)
+        if self.mode == "replay":
+            status, text = self.store.get(key)
+            return TransportResponse(status, text)
+
+        response = requests.get(url, params=params, headers=headers, timeout=timeout)
+        # Errors such as a NewsAPI 429 are not recorded, or replay would serve them forever.
+        if 200 <= response.status_code < 300:
+            self.store.put(key, response.status_code, response.text)
+        return response
+
+    def fetch(self, name, loader):
+        if self.mode == "live":
+            return loader()
+
+        key = request_key("FETCH", name)
+        if self.mode == "replay":
+            _, text = self.store.get(key)
+            return json.loads(text)
+
+        value = loader()
+        self.store.put(key, 200, json.dumps(value, default=str))
+        return value
+
+
+_default_transport = None
+
+
+def get_transport():
+    """Shared transport configured from HTTP_TRANSPORT_MODE and HTTP_CASSETTE_PATH (default: live)."""
+    global _default_transport
+    if _default_transport is None:
+        _default_transport = HTTPTransport(
+            mode=os.getenv("HTTP_TRANSPORT_MODE", "live").lower(),
+            cassette_path=os.getenv("HTTP_CASSETTE_PATH"),
+        )
+    return _default_transport
+
+
+def set_transport(transport):
+    global _default_transport
+    _default_transport = transport
@@ -0,0 +1,305 @@
+import os
+import sys
+import time
+import threading
+import traceback
+import multiprocessing as mp
+from collections import deque
+from concurrent.futures import Future
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.lazy_import import lazy_import
+
+np = lazy_import("numpy")
+torch = lazy_import("torch")
+
+DEFAULT_SPECIALISTS_DIR = os.path.join(os.path.dirname(__file__), "..", "agents", "specialized_agents")
+TOPICS = ["markets_trading", "corporate_business", "crypto_digital_assets"]
+FAMILIES = ("sentiment", "encoder", "generator")
+
+
+class WorkerError(RuntimeError):
+    pass
+
+
+def _load_family(family, config):
+    """Builds the batch handler of a worker: handler(key, items) -> list of results, one per item."""
+    if family == "sentiment":
+        from agents.sentiment_analysis_agent import SentimentAnalysisAgent, _HFBackend
+        # Same backend choice as the in-process agent, including the VADER fallback.
+        backend = SentimentAnalysisAgent(model_name=config.get("sentiment_model")).backend
+        if isinstance(backend, _HFBackend):
+            return lambda key, texts: backend.predict(texts, batch_size=len(texts))
+        return lambda key, texts: backend.predict(texts)
+
+    if family == "encoder":
+        from sentence_transformers import SentenceTransformer
+        model = SentenceTransformer(config.get("encoder_model") or "all-MiniLM-L6-v2", device="cpu")
+        return lambda key, texts: list(model.encode(texts, batch_size=len(texts), convert_to_numpy=True))
+
+    if family == "generator":
+        from agents.specialist_agent import Specialist
+        specialists = {topic: Specialist(topic, base_dir=config["specialists_dir"]) for topic in config["topics"]}
+        return lambda topic, prompts: specialists[topic].generate(prompts)
+
+    raise ValueError(f"Unknown model family '{family}'")
+
+
+def _worker_main(conn, family, config, threads):
+    # Pin the intra-op pool before any model is created so families don't oversubscribe the cores.
+    torch.set_num_threads(threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass
+
+    try:
+        handler = _load_family(family, config)
+    except Exception:
+        conn.send(("error", traceback.format_exc()))
+        return
+    conn.send(("ready", None))
+
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            return
+        if message is None:
+            return
+        key, items = message
+        try:
+            conn.send(("ok", handler(key, items)))
+        except Exception:
+            conn.send(("error", traceback.format_exc()))
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent single-item calls into batches.
+
+    A dispatcher thread waits for the first pending item, then keeps collecting until
+    `max_batch_size` items with the same key are queued or `max_wait_ms` has passed, and
+    hands the batch to `process(key, items)`. Items with another key (e.g. a different
+    specialist topic) stay queued for the next batch. When a batch fails its items are
+    retried one at a time, so only the offending call sees the error.
+    """
+
+    def __init__(self, process, max_batch_size=16, max_wait_ms=5):
+        self.process = process
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.batch_sizes = []
+        self._pending = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, key, item):
+        future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("MicroBatcher is closed")
+            self._pending.append((key, item, future))
+            self._cond.notify()
+        return future
+
+    def _count(self, key):
+        return sum(1 for k, _, _ in self._pending if k == key)
+
+    def _next_batch(self):
+        with self._cond:
+            while not self._pending and not self._closed:
+                self._cond.wait()
+            if not self._pending:
+                return None, []
+            key = self._pending[0][0]
+            deadline = time.monotonic() + self.max_wait
+            while self._count(key) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._closed:
+                    break
+                self._cond.wait(remaining)
+
+            batch, rest = [], deque()
+            for entry in self._pending:
+                if entry[0] == key and len(batch) < self.max_batch_size:
+                    batch.append(entry)
+                else:
+                    rest.append(entry)
+            self._pending = rest
+            return key, batch
+
+    def _run(self):
+        while True:
+            key, batch = self._next_batch()
+            if not batch:
+                return
+            self.batch_sizes.append(len(batch))
+            try:
+                results = self.process(key, [item for _, item, _ in batch])
+            except Exception as e:
+                if len(batch) == 1:
+                    batch[0][2].set_exception(e)
+                    continue
+                # Retry one by one so a single bad input only fails its own caller.
+                for _, item, future in batch:
+                    try:
+                        future.set_result(self.process(key, [item])[0])
+                    except Exception as item_error:
+                        future.set_exception(item_error)
+                continue
+            for (_, _, future), result in zip(batch, results):
+                future.set_result(result)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+
+class _Worker:
+    """Parent-side handle of one model-family process; one batch in flight at a time."""
+
+    def __init__(self, family, config, threads, ctx):
+        self.family = family
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child_conn, family, config, threads), daemon=True, name=f"model-{family}")
+        self.process.start()
+        child_conn.close()
+
+    def wait_ready(self):
+        status, payload = self.conn.recv()
+        if status != "ready":
+            raise WorkerError(f"{self.family} worker failed to start:\n{payload}")
+
+    def run(self, key, items):
+        self.conn.send((key, items))
+        try:
+            status, payload = self.conn.recv()
+        except EOFError:
+            raise WorkerError(f"{self.family} worker died")
+        if status != "ok":
+            raise WorkerError(payload)
+        return payload
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=10)
+        if self.process.is_alive():
+            self.process.terminate()
+
+
+class ModelPool:
+    """
+    Runs FinBERT, MiniLM and the flan-t5 specialists in one worker process per model
+    family, each with its own pinned torch thread count, behind a MicroBatcher.
+
+    The proxies returned by `sentiment_backend()`, `encoder()` and `generator(topic)` plug
+    into SentimentAnalysisAgent(backend=...), EvaluatorOptimizer(model=...) and
+    Specialist(topic, generator=...), so the agents are unchanged and any number of threads
+    can share them: concurrent calls are coalesced into one forward pass per family.
+    """
+
+    def __init__(self, sentiment_model=None, encoder_model=None, specialists_dir=DEFAULT_SPECIALISTS_DIR, topics=TOPICS,
+                 families=FAMILIES, threads=None, max_batch_size=16, max_wait_ms=5):
+        self.config = {
+            "sentiment_model": sentiment_model,
+            "encoder_model": encoder_model,
+            "specialists_dir": specialists_dir,
+            "topics": list(topics),
+        }
+        self.families = tuple(families)
+        self.threads = threads or self.default_threads(self.families)
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.workers = {}
+        self.batchers = {}
+
+    @staticmethod
+    def default_threads(families):
+        """Splits the available cores evenly between families, at least one thread each."""
+        cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+        per_family = max(1, cores // len(families))
+        return {family: per_family for family in families}
+
+    def start(self):
+        ctx = mp.get_context("spawn")
+        for family in self.families:
+            self.workers[family] = _Worker(family, self.config, self.threads[family], ctx)
+        for family, worker in self.workers.items():
+            worker.wait_ready()
+            self.batchers[family] = MicroBatcher(worker.run, self.max_batch_size, self.max_wait_ms)
+        return self
+
+    def close(self):
+        for batcher in self.batchers.values():
+            batcher.close()
+        for worker in self.workers.values():
+            worker.stop()
+        self.batchers, self.workers = {}, {}
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def submit(self, family, key, item):
+        if family not in self.batchers:
+            raise WorkerError(f"No '{family}' worker running, start the pool with it in `families`")
+        return self.batchers[family].submit(key, item)
+
+    def sentiment_backend(self):
+        return PooledSentimentBackend(self)
+
+    def encoder(self):
+        return PooledEncoder(self)
+
+    def generator(self, topic):
+        if topic not in self.config["topics"]:
+            raise ValueError(f"Topic '{topic}' is not loaded in this pool")
+        return PooledGenerator(self, topic)
+
+
+class PooledSentimentBackend:
+    name = "model_pool"
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    def predict(self, texts):
+        futures = [self.pool.submit("sentiment", None, text) for text in texts]
+        return [future.result() for future in futures]
+
+
+class PooledEncoder:
+    """Covers the part of SentenceTransformer.encode used by EvaluatorOptimizer."""
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    def encode(self, sentences, convert_to_tensor=False, **kwargs):
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        futures = [self.pool.submit("encoder", None, text) for text in texts]
+        embeddings = np.stack([future.result() for future in futures]) if texts else np.empty((0, 0), dtype=np.float32)
+        if convert_to_tensor:
+            embeddings = torch.from_numpy(embeddings)
+        return embeddings[0] if single else embeddings
+
+
+class PooledGenerator:
+
+    def __init__(self, pool, topic):
+        self.pool = pool
+        self.topic = topic
+
+    def generate(self, prompt):
+        return self.pool.submit("generator", self.topic, prompt).result()
@@ -0,0 +1,340 @@
+import os
+import sys
+import json
+import argparse
+import threading
+import http.client
+from contextlib import nullcontext
+from dataclasses import asdict
+from urllib.parse import urlparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from agents.sentiment_analysis_agent import SentimentResult
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_SPECIALISTS_DIR = os.path.join(os.path.dirname(__file__), "..", "agents", "specialized_agents")
+TOPICS = ["markets_trading", "corporate_business", "crypto_digital_assets"]
+
+# Checked before the agent runs, so a KeyError raised by model code is a 500, not the client's fault.
+REQUIRED_FIELDS = {
+    "/sentiment/predict_one": ["text"],
+    "/sentiment/predict_batch": ["texts"],
+    "/evaluator/evaluate_response": ["original_query", "news_summaries", "past_queries", "specialist_response"],
+    "/specialist/respond": ["topic", "query", "news_summaries", "past_queries"],
+}
+
+
+class ModelServer:
+    """
+    Long-lived process that keeps SentimentAnalysisAgent, EvaluatorOptimizer and the
+    Specialists loaded and serves them as JSON over localhost HTTP.
+
+    Models are loaded on first request (or up front with `preload`) and every model has
+    its own lock, so concurrent clients share the weights without racing on them.
+    With a started utils.model_pool.ModelPool the agents run on the pool instead and
+    requests are not serialised, letting the pool batch concurrent calls together.
+    """
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, sentiment_model=None, evaluator_model=None, specialists_dir=DEFAULT_SPECIALISTS_DIR, pool=None):
+        self.host = host
+        self.port = port
+        self.sentiment_model = sentiment_model
+        self.evaluator_model = evaluator_model
+        self.specialists_dir = specialists_dir
+        self.pool = pool
+        self._agents = {}
+        self._locks = {}
+        self._registry_lock = threading.Lock()
+        self._server = None
+        self.routes = {
+            "/health": self._health,
+            "/sentiment/predict_one": self._sentiment_predict_one,
+            "/sentiment/predict_batch": self._sentiment_predict_batch,
+            "/evaluator/evaluate_response": self._evaluate_response,
+            "/specialist/respond": self._specialist_respond,
+        }
+
+    def _load_pooled(self, name):
+        if name == "sentiment":
+            from agents.sentiment_analysis_agent import SentimentAnalysisAgent
+            return SentimentAnalysisAgent(backend=self.pool.sentiment_backend())
+        if name == "evaluator":
+            from agents.evaluator_optimizer_agent import EvaluatorOptimizer
+            return EvaluatorOptimizer(model=self.pool.encoder())
+        if name.startswith("specialist/"):
+            from agents.specialist_agent import Specialist
+            topic = name.split("/", 1)[1]
+            return Specialist(topic, generator=self.pool.generator(topic))
+        raise KeyError(name)
+
+    def _load(self, name):
+        if self.pool is not None:
+            return self._load_pooled(name)
+        if name == "sentiment":
+            from agents.sentiment_analysis_agent import SentimentAnalysisAgent
+            return SentimentAnalysisAgent(model_name=self.sentiment_model)
+        if name == "evaluator":
+            from agents.evaluator_optimizer_agent import EvaluatorOptimizer
+            if self.evaluator_model:
+                return EvaluatorOptimizer(model_name=self.evaluator_model)
+            return EvaluatorOptimizer()
+        if name.startswith("specialist/"):
+            from agents.specialist_agent import Specialist
+            return Specialist(name.split("/", 1)[1], base_dir=self.specialists_dir)
+        raise KeyError(name)
+
+    def agent(self, name):
+        """Returns the loaded agent and its lock, loading it the first time it is asked for."""
+        with self._registry_lock:
+            lock = self._locks.setdefault(name, threading.Lock())
+        with lock:
+            if name not in self._agents:
+                self._agents[name] = self._load(name)
+        if self.pool is not None:
+            return self._agents[name], nullcontext()
+        return self._agents[name], lock
+
+    def preload(self, topics=TOPICS):
+        self.agent("sentiment")
+        self.agent("evaluator")
+        for topic in topics:
+            self.agent(f"specialist/{topic}")
+
+    def _health(self, payload):
+        return {"status": "ok", "loaded": sorted(self._agents)}
+
+    def _sentiment_predict_one(self, payload):
+        agent, lock = self.agent("sentiment")
+        with lock:
+            result = agent.predict_one(payload["text"], id=payload.get("id"))
+        return asdict(result)
+
+    def _sentiment_predict_batch(self, payload):
+        agent, lock = self.agent("sentiment")
+        with lock:
+            results = agent.predict_batch(payload["texts"], ids=payload.get("ids"))
+        return [asdict(r) for r in results]
+
+    def _evaluate_response(self, payload):
+        agent, lock = self.agent("evaluator")
+        with lock:
+            return agent.evaluate_response(
+                original_query=payload["original_query"],
+                news_summaries=payload["news_summaries"],
+                past_queries=payload["past_queries"],
+                specialist_response=payload["specialist_response"],
+            )
+
+    def _specialist_respond(self, payload):
+        agent, lock = self.agent(f"specialist/{payload['topic']}")
+        with lock:
+            answer, prompt = agent.respond(
+                query=payload["query"],
+                news_summaries=payload["news_summaries"],
+                past_queries=payload["past_queries"],
+                feedback=payload.get("feedback", ""),
+                SA_label=payload.get("SA_label", ""),
+            )
+        return {"answer": answer, "prompt": prompt}
+
+    def handle(self, path, payload):
+        if path not in self.routes:
+            return 404, {"error": f"Unknown endpoint '{path}'"}
+        missing = [field for field in REQUIRED_FIELDS.get(path, []) if field not in payload]
+        if missing:
+            return 400, {"error": f"Missing field(s): {', '.join(missing)}"}
+        if path == "/specialist/respond" and payload["topic"] not in TOPICS:
+            return 400, {"error": f"Unknown topic '{payload['topic']}'"}
+        try:
+            return 200, self.routes[path](payload)
+        except Exception as e:
+            return 500, {"error": f"{type(e).__name__}: {e}"}
+
+    def start(self):
+        """Starts serving on a background thread and returns self (port 0 picks a free port)."""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are separate writes; without this, keep-alive replies stall on delayed ACKs.
+            disable_nagle_algorithm = True
+
+            def _reply(self, status, body):
+                data = json.dumps(body, default=float).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                self._reply(*server.handle(self.path, {}))
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                self._reply(*server.handle(self.path, payload))
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def serve_forever(self):
+        self.start()
+        print(f"Model server listening on http://{self.host}:{self.port}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+
+class ModelServerError(RuntimeError):
+    pass
+
+
+class ModelServerClient:
+    """Minimal JSON client for ModelServer. Only uses the standard library so it starts instantly."""
+
+    def __init__(self, url=None, timeout=600):
+        parsed = urlparse(url or os.getenv("MODEL_SERVER_URL", f"http://{DEFAULT_HOST}:{DEFAULT_PORT}"))
+        self.host = parsed.hostname
+        self.port = parsed.port
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            self._local.conn = conn
+        return conn
+
+    def call(self, path, payload=None):
+        body = json.dumps(payload or {}).encode("utf-8")
+        for attempt in range(2):
+            conn = self._connection()
+            try:
+                conn.request("POST", path, body=body, headers={"Content-Type": "application/json"})
+                response = conn.getresponse()
+                data = json.loads(response.read())
+                break
+            except (ConnectionError, http.client.HTTPException):
+                # Keep-alive connection dropped by the server: reconnect once.
+                conn.close()
+                self._local.conn = None
+                if attempt:
+                    raise
+        if response.status != 200:
+            raise ModelServerError(data.get("error", f"HTTP {response.status}"))
+        return data
+
+    def health(self):
+        return self.call("/health")
+
+
+class RemoteSentimentAnalysisAgent:
+    """Drop-in replacement for SentimentAnalysisAgent backed by the model server."""
+
+    backend_name = "model_server"
+
+    def __init__(self, client=None):
+        self.client = client or ModelServerClient()
+
+    def predict_one(self, text, *, id=None):
+        return SentimentResult(**self.client.call("/sentiment/predict_one", {"text": text, "id": id}))
+
+    def predict_batch(self, texts, *, ids=None):
+        results = self.client.call("/sentiment/predict_batch", {"texts": list(texts), "ids": ids})
+        return [SentimentResult(**r) for r in results]
+
+
+class RemoteEvaluatorOptimizer:
+    """Drop-in replacement for EvaluatorOptimizer backed by the model server."""
+
+    def __init__(self, client=None):
+        self.client = client or ModelServerClient()
+
+    def evaluate_response(self, original_query, news_summaries, past_queries, specialist_response):
+        return self.client.call("/evaluator/evaluate_response", {
+            "original_query": original_query,
+            "news_summaries": news_summaries,
+            "past_queries": past_queries,
+            "specialist_response": specialist_response,
+        })
+
+
+class RemoteSpecialist:
+    """Drop-in replacement for Specialist backed by the model server."""
+
+    def __init__(self, topic, client=None):
+        self.topic = topic
+        self.client = client or ModelServerClient()
+
+    def respond(self, query, news_summaries, past_queries, feedback="", SA_label=""):
+        result = self.client.call("/specialist/respond", {
+            "topic": self.topic,
+            "query": query,
+            "news_summaries": news_summaries,
+            "past_queries": past_queries,
+            "feedback": feedback,
+            "SA_label": SA_label,
+        })
+        return result["answer"], result["prompt"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keep the agent models loaded and serve them over localhost HTTP.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--sentiment-model", default=None, help="defaults to FINBERT_MODEL or yiyanghkust/finbert-tone")
+    parser.add_argument("--evaluator-model", default=None, help="defaults to all-MiniLM-L6-v2")
+    parser.add_argument("--specialists-dir", default=DEFAULT_SPECIALISTS_DIR)
+    parser.add_argument("--preload", action="store_true", help="load every model before accepting requests")
+    parser.add_argument("--workers", action="store_true", help="run each model family in its own process with micro-batching")
+    parser.add_argument("--max-batch-size", type=int, default=16)
+    parser.add_argument("--max-wait-ms", type=float, default=5)
+    args = parser.parse_args()
+
+    pool = None
+    if args.workers:
+        from utils.model_pool import ModelPool
+        pool = ModelPool(
+            sentiment_model=args.sentiment_model,
+            encoder_model=args.evaluator_model,
+            specialists_dir=args.specialists_dir,
+            max_batch_size=args.max_batch_size,
+            max_wait_ms=args.max_wait_ms,
+        ).start()
+
+    server = ModelServer(args.host, args.port, args.sentiment_model, args.evaluator_model, args.specialists_dir, pool=pool)
+    if args.preload:
+        server.preload()
+    try:
+        server.serve_forever()
+    finally:
+        if pool is not None:
+            pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,12 @@
+import os
 import requests
+from utils.http_transport import CassetteMiss, get_transport
 
-def get_ticker_from_company_name(company_name):
+YAHOO_SEARCH_URL = os.getenv("YAHOO_SEARCH_URL", "https://query1.finance.yahoo.com/v1/finance/search")
+
+def get_ticker_from_company_name(company_name, transport=None):
     try:
-        url = "https://query1.finance.yahoo.com/v1/finance/search"
+        url = YAHOO_SEARCH_URL
         params = {
             'q': company_name,
             'quotesCount': 5,
@@ -11,7 +15,8 @@ def get_ticker_from_company_name(company_name):
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
-        response = requests.get(url, params=params, headers=headers, timeout=10)
+        transport = transport or get_transport()
+        response = transport.get(url, params=params, headers=headers, timeout=10)
         if response.status_code == 200:
             data = response.json()
             quotes = data.get('quotes', [])
@@ -24,6 +29,8 @@ def get_ticker_from_company_name(company_name):
         else:
             return None
             
+    except CassetteMiss:
+        raise
     except requests.exceptions.Timeout:
         return None
     except requests.exceptions.ConnectionError: